@@ -0,0 +1,58 @@
+"""add covering index on users email
+
+Replaces the plain unique ix_users_email, so email keeps a single unique index.
+
+Revision ID: 3b9f2c7d41e8
+Revises: 00df3e0ab26c
+Create Date: 2026-10-18 09:12:04.318220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f2c7d41e8'
+down_revision: Union[str, Sequence[str], None] = '00df3e0ab26c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_covering',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_include=['hashed_password', 'is_active', 'id', 'role'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Only dropped once the covering index enforces uniqueness in its place
+        op.drop_index(
+            'ix_users_email',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_users_email_covering',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,40 @@
+"""index response_history thread_id, created_at, id
+
+Revision ID: 4d1a7f3c9e62
+Revises: b2f8d4e6a0c7
+Create Date: 2026-10-18 12:31:16.084527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4d1a7f3c9e62'
+down_revision: Union[str, Sequence[str], None] = 'b2f8d4e6a0c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_response_history_thread_id_created_at_id',
+            'response_history',
+            ['thread_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_response_history_thread_id_created_at_id',
+            table_name='response_history',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,54 @@
+"""index user_sessions user_id and expires_at
+
+Revision ID: 7c1e5a9d2f30
+Revises: 3b9f2c7d41e8
+Create Date: 2026-10-18 10:02:41.577093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9d2f30'
+down_revision: Union[str, Sequence[str], None] = '3b9f2c7d41e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_user_sessions_user_id'),
+            'user_sessions',
+            ['user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_user_sessions_expires_at'),
+            'user_sessions',
+            ['expires_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_user_sessions_expires_at'),
+            table_name='user_sessions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f('ix_user_sessions_user_id'),
+            table_name='user_sessions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
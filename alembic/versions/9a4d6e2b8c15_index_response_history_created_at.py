@@ -0,0 +1,41 @@
+"""index response_history created_at including thread_id
+
+Revision ID: 9a4d6e2b8c15
+Revises: 7c1e5a9d2f30
+Create Date: 2026-10-18 11:24:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d6e2b8c15'
+down_revision: Union[str, Sequence[str], None] = '7c1e5a9d2f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_response_history_created_at',
+            'response_history',
+            ['created_at'],
+            unique=False,
+            postgresql_include=['thread_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_response_history_created_at',
+            table_name='response_history',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,37 @@
+"""add conversation_ids to cases
+
+Revision ID: b2f8d4e6a0c7
+Revises: e5b7c3a1d9f4
+Create Date: 2026-10-18 12:05:52.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f8d4e6a0c7'
+down_revision: Union[str, Sequence[str], None] = 'e5b7c3a1d9f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default makes this a catalog-only change on Postgres 11+
+    op.add_column(
+        'cases',
+        sa.Column(
+            'conversation_ids',
+            postgresql.JSONB(),
+            nullable=False,
+            server_default='[]',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('cases', 'conversation_ids')
@@ -0,0 +1,42 @@
+"""convert response_history input and output to jsonb
+
+Revision ID: e5b7c3a1d9f4
+Revises: 9a4d6e2b8c15
+Create Date: 2026-10-18 11:41:09.215683
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7c3a1d9f4'
+down_revision: Union[str, Sequence[str], None] = '9a4d6e2b8c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in ('input', 'output'):
+        op.alter_column(
+            'response_history',
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ('input', 'output'):
+        op.alter_column(
+            'response_history',
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json',
+        )
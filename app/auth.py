@@ -1,60 +1,319 @@
+import asyncio
+import base64
+import binascii
+import math
+import os
 import secrets
-from datetime import UTC, datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import bcrypt
+import jwt
+import orjson
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from .core.config_service import get_config
 from .core.logger_manager import get_logger, set_user_id
+from .core.performance_utils import AsyncCache
 from .dependencies import get_db
-from .models import User
+from .models import User, UserRole
 
 logger = get_logger(__name__)
 
+__all__ = [
+    "oauth2_scheme",
+    "verify_password",
+    "authenticate_password",
+    "get_password_hash",
+    "calibrate_bcrypt_rounds",
+    "password_needs_rehash",
+    "create_access_token",
+    "create_session_token",
+    "decode_token",
+    "decode_access_token",
+    "get_current_user",
+    "get_current_active_user",
+    "invalidate_cached_user",
+    "check_user_permissions",
+    "require_admin",
+    "require_lawyer",
+    "require_paralegal",
+]
+
 # Get configuration
 config = get_config()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Token settings are snapshotted at import; signing material is not unwrapped per token
+_JWT_SECRET = config.security.secret_key.get_secret_value()
+_JWT_ALGORITHM = config.security.algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_LIFETIME_SECONDS = config.security.access_token_expire_minutes * 60
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT decoder that parses the claims segment with orjson instead of stdlib json."""
+
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+# Claims are decoded through this instance rather than the module-level jwt.decode
+_jwt = _OrjsonJWT()
+
+# Password hashing - native bcrypt; passlib is only loaded for legacy non-bcrypt hashes
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# bcrypt cost factor; set by calibrate_bcrypt_rounds() at startup to fit the latency budget
+_BCRYPT_MIN_ROUNDS = 10
+_BCRYPT_MAX_ROUNDS = 15
+_bcrypt_rounds = 12
+
+# Hash checked against when no user matches, so unknown emails cost the same bcrypt work
+_dummy_hash: Optional[str] = None
+
+# bcrypt releases the GIL, so hashing in worker threads keeps the event loop responsive
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+
+class _BearerTokenScheme(OAuth2PasswordBearer):
+    """
+    OAuth2 password-bearer scheme that slices the token straight out of the header.
+
+    Keeps the OpenAPI security definition of OAuth2PasswordBearer while skipping
+    its generic scheme/param parsing on every authenticated request.
+    """
+
+    async def __call__(self, request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            return authorization[7:]
+        if self.auto_error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
+
 
 # OAuth2 scheme
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+oauth2_scheme = _BearerTokenScheme(tokenUrl="/api/auth/login")
+
+# Per-thread entropy pool for session tokens; one urandom call serves 128 tokens
+_SESSION_TOKEN_BYTES = 32
+_ENTROPY_POOL_SIZE = 4096
+_entropy = threading.local()
+
+# Decoded JWT payloads keyed by the raw token; entries never outlive the token's exp
+_TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache = AsyncCache(max_size=10_000, default_ttl=timedelta(seconds=_TOKEN_CACHE_TTL_SECONDS))
+
+# Detached snapshots of authenticated users keyed by id; kept short so role/status changes
+# made by another process are picked up quickly
+_USER_CACHE_TTL_SECONDS = 15
+_user_cache = AsyncCache(max_size=10_000, default_ttl=timedelta(seconds=_USER_CACHE_TTL_SECONDS))
+
+
+@lru_cache(maxsize=1)
+def _legacy_pwd_context():
+    """Passlib context for hashes that were not produced by bcrypt."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    return _legacy_pwd_context().verify(plain_password, hashed_password)
+
+
+def _get_password_hash_sync(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=_bcrypt_rounds)).decode(
+        "utf-8"
+    )
+
+
+def calibrate_bcrypt_rounds(target_ms: Optional[int] = None) -> int:
+    """
+    Pick the smallest bcrypt cost whose hash time reaches the target on this CPU.
+
+    Each extra round doubles the work, so a single timed hash at the minimum
+    cost is enough to extrapolate.
+    """
+    global _bcrypt_rounds, _dummy_hash
+    target = (target_ms or config.security.bcrypt_target_ms) / 1000
+    salt = bcrypt.gensalt(rounds=_BCRYPT_MIN_ROUNDS)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", salt)
+    elapsed = max(time.perf_counter() - start, 1e-6)
+
+    extra = max(0, math.ceil(math.log2(target / elapsed)))
+    _bcrypt_rounds = min(_BCRYPT_MAX_ROUNDS, _BCRYPT_MIN_ROUNDS + extra)
+    _dummy_hash = _get_password_hash_sync(secrets.token_urlsafe(16))
+    logger.info(f"bcrypt cost calibrated to {_bcrypt_rounds} rounds (target {target * 1000:.0f}ms)")
+    return _bcrypt_rounds
+
+
+def _verify_password_or_dummy_sync(plain_password: str, hashed_password: Optional[str]) -> bool:
+    global _dummy_hash
+    if hashed_password is not None:
+        return _verify_password_sync(plain_password, hashed_password)
+    if _dummy_hash is None:
+        _dummy_hash = _get_password_hash_sync(secrets.token_urlsafe(16))
+    _verify_password_sync(plain_password, _dummy_hash)
+    return False
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash is weaker than the current bcrypt cost."""
+    if not hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return int(hashed_password[4:6]) < _bcrypt_rounds
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, _verify_password_sync, plain_password, hashed_password
+    )
+
+
+async def authenticate_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password for a login attempt.
+
+    When the user does not exist (``hashed_password`` is None) a dummy hash is
+    checked instead so the response time does not reveal whether the account exists.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, _verify_password_or_dummy_sync, plain_password, hashed_password
+    )
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, _get_password_hash_sync, password)
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(UTC) + timedelta(minutes=config.security.access_token_expire_minutes)
+        lifetime = _ACCESS_TOKEN_LIFETIME_SECONDS
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        config.security.secret_key.get_secret_value(),
-        algorithm=config.security.algorithm,
-    )
+    # jwt stores exp as an integer epoch, so skip building a tz-aware datetime
+    to_encode["exp"] = int(time.time()) + lifetime
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
 def create_session_token() -> str:
     """Create a secure random session token."""
-    return secrets.token_urlsafe(32)
+    pool = getattr(_entropy, "pool", None)
+    offset = getattr(_entropy, "offset", _ENTROPY_POOL_SIZE)
+    if pool is None or offset + _SESSION_TOKEN_BYTES > _ENTROPY_POOL_SIZE:
+        pool = _entropy.pool = os.urandom(_ENTROPY_POOL_SIZE)
+        offset = 0
+    _entropy.offset = offset + _SESSION_TOKEN_BYTES
+    token_bytes = pool[offset : offset + _SESSION_TOKEN_BYTES]
+    return base64.urlsafe_b64encode(token_bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired
+    """
+    return _jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+
+
+def _peek_exp(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim without verifying the signature.
+
+    Only used to reject already-expired tokens before paying for a full verification;
+    a forged value can at worst get its own token rejected. Returns None when the
+    token is malformed so that full verification reports the real error.
+    """
+    try:
+        segment = token.split(".", 2)[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except (IndexError, ValueError, binascii.Error):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return exp if isinstance(exp, (int, float)) else None
+
+
+async def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing the payload of recently verified tokens.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired
+    """
+    payload = await _token_cache.get(token)
+    now = time.time()
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload
+
+    exp = _peek_exp(token)
+    if exp is not None and exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    payload = decode_token(token)
+    exp = payload.get("exp")
+    ttl = _TOKEN_CACHE_TTL_SECONDS if exp is None else min(_TOKEN_CACHE_TTL_SECONDS, exp - now)
+    if ttl > 0:
+        await _token_cache.set(token, payload, timedelta(seconds=ttl))
+    return payload
+
+
+async def _get_user(session: AsyncSession, user_id: str) -> Optional[User]:
+    """
+    Load a user for the request, serving recently seen users from the user cache.
+
+    The cache holds detached copies; merging with ``load=False`` attaches a fresh
+    instance to the request session without a round trip to the database.
+    """
+    cached = await _user_cache.get(user_id)
+    if cached is not None:
+        return await session.merge(cached, load=False)
+
+    user = await session.get(User, user_id)
+    if user is not None:
+        snapshot = User(**user.model_dump())
+        make_transient_to_detached(snapshot)
+        await _user_cache.set(user_id, snapshot)
+    return user
+
+
+async def invalidate_cached_user(user_id: Any) -> None:
+    """Drop a user from the user cache after its row has been changed."""
+    await _user_cache.delete(str(user_id))
 
 
 async def get_current_user(
@@ -68,23 +327,19 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token,
-            config.security.secret_key.get_secret_value(),
-            algorithms=[config.security.algorithm],
-        )
-        logger.debug(f"Decoded token: {payload}")
+        payload = await decode_access_token(token)
+        logger.debug("Decoded token for user_id=%s", payload.get("user_id"))
         user_id: Optional[str] = payload.get("user_id")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
 
-    user = await session.get(User, user_id)
+    user = await _get_user(session, user_id)
     if user is None:
         logger.error(f"User not found: {user_id}")
         raise credentials_exception
-    logger.debug(f"User found: {user.model_dump_json(indent=2)}")
+    logger.debug("User found: %s", user.id)
     set_user_id(request, str(user.id))
 
     if not user.is_active:
@@ -93,18 +348,23 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
-    """Get current active user."""
-    if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
+# get_current_user already rejects inactive users, so the active-user dependency is the same one
+get_current_active_user = get_current_user
 
 
 def check_user_permissions(required_roles: Optional[list[str]] = None, allow_own_resource: bool = False):
     """Dependency to check user permissions."""
+    # Roles are resolved to UserRole members once so the per-request check is a single
+    # hash lookup on the loaded enum, with no per-request normalization
+    allowed_roles = frozenset(UserRole(getattr(role, "value", role)) for role in required_roles or ())
+    return _permission_checker(allowed_roles, allow_own_resource)
+
 
+@lru_cache(maxsize=None)
+def _permission_checker(allowed_roles: frozenset, allow_own_resource: bool):
+    # Memoized so equal role sets share one callable and FastAPI reuses its dependency node
     async def permission_checker(
-        current_user: User = Depends(get_current_active_user),
+        current_user: User = Depends(get_current_user),
         resource_owner_id: Optional[str] = None,
     ) -> User:
         # If allowing own resource access and user owns the resource
@@ -112,7 +372,7 @@ def check_user_permissions(required_roles: Optional[list[str]] = None, allow_own
             return current_user
 
         # Check role-based permissions
-        if required_roles and current_user.role not in required_roles:
+        if allowed_roles and current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
             )
@@ -122,14 +382,7 @@ def check_user_permissions(required_roles: Optional[list[str]] = None, allow_own
     return permission_checker
 
 
-# Commonly used permission dependencies
-def require_admin():
-    return check_user_permissions(required_roles=["admin"])
-
-
-def require_lawyer():
-    return check_user_permissions(required_roles=["admin", "lawyer"])
-
-
-def require_paralegal():
-    return check_user_permissions(required_roles=["admin", "lawyer", "paralegal"])
+# Commonly used permission dependencies (built once so FastAPI can cache them per request)
+require_admin = check_user_permissions(required_roles=["admin"])
+require_lawyer = check_user_permissions(required_roles=["admin", "lawyer"])
+require_paralegal = check_user_permissions(required_roles=["admin", "lawyer", "paralegal"])
@@ -1,33 +1,43 @@
 """
 Core infrastructure modules for the AI Paralegal system.
+
+Submodules are imported lazily (PEP 562) so that importing ``app.core`` does not pull
+in SQLAlchemy or the LLM SDKs until one of their symbols is actually used.
 """
 
-from .config_service import AppConfig, ConfigService, get_config
-from .database_manager import DatabaseManager, UnitOfWork
-from .exceptions import (
-    CaseError,
-    ConfigurationError,
-    DatabaseError,
-    DocumentError,
-    LLMError,
-    ParalegalException,
-    SearchError,
-    ServiceError,
-    ServiceNotInitializedError,
-    ServiceUnavailableError,
-    ToolError,
-    ToolExecutionError,
-    ToolNotFoundError,
-    ValidationError,
-)
-from .llm_manager import LLMManager
-from .service_interface import (
-    HealthCheckResult,
-    ServiceContainer,
-    ServiceInterface,
-    ServiceLifecycleManager,
-    ServiceStatus,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config_service import AppConfig, ConfigService, get_config
+    from .database_manager import DatabaseManager, UnitOfWork
+    from .exceptions import (
+        CaseError,
+        ConfigurationError,
+        DatabaseError,
+        DocumentError,
+        LLMError,
+        ParalegalException,
+        SearchError,
+        ServiceError,
+        ServiceNotInitializedError,
+        ServiceUnavailableError,
+        ToolError,
+        ToolExecutionError,
+        ToolNotFoundError,
+        ValidationError,
+    )
+    from .llm_manager import LLMManager
+    from .service_interface import (
+        HealthCheckResult,
+        ServiceContainer,
+        ServiceInterface,
+        ServiceLifecycleManager,
+        ServiceStatus,
+    )
+
+# The registry instance shares its name with its submodule: importing the submodule anywhere
+# would bind the module object here first, so the registry is imported eagerly (pydantic only)
 from .tool_registry import (
     ToolCategory,
     ToolDefinition,
@@ -36,6 +46,55 @@ from .tool_registry import (
     tool_registry,
 )
 
+# Exported name -> submodule that defines it
+_LAZY = {
+    # Configuration
+    "get_config": "config_service",
+    "AppConfig": "config_service",
+    "ConfigService": "config_service",
+    # Database
+    "DatabaseManager": "database_manager",
+    "UnitOfWork": "database_manager",
+    # Exceptions
+    "ParalegalException": "exceptions",
+    "ConfigurationError": "exceptions",
+    "ServiceError": "exceptions",
+    "ToolError": "exceptions",
+    "ValidationError": "exceptions",
+    "DatabaseError": "exceptions",
+    "LLMError": "exceptions",
+    "DocumentError": "exceptions",
+    "SearchError": "exceptions",
+    "CaseError": "exceptions",
+    "ToolExecutionError": "exceptions",
+    "ToolNotFoundError": "exceptions",
+    "ServiceNotInitializedError": "exceptions",
+    "ServiceUnavailableError": "exceptions",
+    # LLM Management
+    "LLMManager": "llm_manager",
+    # Service Infrastructure
+    "ServiceInterface": "service_interface",
+    "ServiceContainer": "service_interface",
+    "ServiceLifecycleManager": "service_interface",
+    "ServiceStatus": "service_interface",
+    "HealthCheckResult": "service_interface",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Configuration
     "get_config",
@@ -2,13 +2,14 @@
 AI Client Factory for managing different AI providers
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Type, Union
 from enum import Enum
 
 from pydantic import BaseModel
 
-from app.services.openai_client import OpenAIService
+from app.services.openai_client import OpenAIService, get_openai_service
 
 
 class AIProvider(str, Enum):
@@ -22,6 +23,8 @@ class AIProvider(str, Enum):
 class AIClientInterface(ABC):
     """Abstract interface for AI clients"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def parse_structured_output(
         self,
@@ -89,9 +92,16 @@ class AIClientInterface(ABC):
         pass
 
 
+# OpenAIService already provides every interface method with matching signatures, so it is
+# registered as a virtual subclass and handed out directly instead of through a forwarding adapter
+AIClientInterface.register(OpenAIService)
+
+
 class OpenAIClientAdapter(AIClientInterface):
     """Adapter for OpenAI service to implement the common interface"""
     
+    __slots__ = ("service",)
+    
     def __init__(self, openai_service: OpenAIService):
         self.service = openai_service
     
@@ -154,6 +164,8 @@ class AIClientFactory:
     """Factory for creating AI clients"""
     
     _clients: Dict[AIProvider, AIClientInterface] = {}
+    _openai_client: Optional[AIClientInterface] = None
+    _lock = threading.Lock()
     
     @classmethod
     def get_client(cls, provider: AIProvider = AIProvider.OPENAI) -> AIClientInterface:
@@ -169,15 +181,29 @@ class AIClientFactory:
         Raises:
             ValueError: If the provider is not supported
         """
-        if provider in cls._clients:
-            return cls._clients[provider]
+        # OpenAI is the only provider in use: an identity check on the enum member
+        # skips hashing it for the dict lookup
+        if provider is AIProvider.OPENAI:
+            client = cls._openai_client
+            if client is not None:
+                return client
         
-        if provider == AIProvider.OPENAI:
-            from app.services.openai_client import get_openai_service
-            client = OpenAIClientAdapter(get_openai_service())
-            cls._clients[provider] = client
+        client = cls._clients.get(provider)
+        if client is not None:
             return client
         
+        with cls._lock:
+            # Another thread may have created the client while we waited
+            client = cls._clients.get(provider)
+            if client is not None:
+                return client
+
+            if provider == AIProvider.OPENAI:
+                client = get_openai_service()
+                cls._clients[provider] = client
+                cls._openai_client = client
+                return client
+        
         # Future providers can be added here
         # elif provider == AIProvider.ANTHROPIC:
         #     return AnthropicClientAdapter()
@@ -189,13 +215,14 @@ class AIClientFactory:
     @classmethod
     def get_openai_client(cls) -> OpenAIService:
         """Convenience method to get OpenAI client directly"""
-        from app.services.openai_client import get_openai_service
         return get_openai_service()
     
     @classmethod
     def clear_cache(cls):
         """Clear the client cache (useful for testing)"""
-        cls._clients.clear()
+        with cls._lock:
+            cls._clients.clear()
+            cls._openai_client = None
 
 
 # Convenience function
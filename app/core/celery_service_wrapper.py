@@ -3,19 +3,54 @@ Service wrapper to integrate Celery tasks with existing services.
 Provides async/sync interface switching for microservices architecture.
 """
 
+import asyncio
+import itertools
+import logging
 import threading
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar, Union
+from weakref import WeakKeyDictionary
 
+import redis
+import redis.asyncio as aioredis
+from celery import states
 from celery.result import AsyncResult
 
+from app.core.exceptions import BackpressureError
 from app.core.logger_manager import get_logger
+from app.worker.config import WORKER_HEARTBEATS_KEY
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Queued sends are logged individually at DEBUG only; INFO gets one line per this many
+_QUEUED_LOG_INTERVAL = 1000
+
+# Batch size auto-tuning: EMA of (flush duration / time between flushes). A flusher that is
+# busy nearly all the time grows its batches to amortize more; an idle one shrinks them to
+# cut latency.
+_BATCH_EMA_ALPHA = 0.2
+_BATCH_GROW_ABOVE = 0.95
+_BATCH_SHRINK_BELOW = 0.9
+_BATCH_SIZE_MIN = 1
+_BATCH_SIZE_MAX = 5000
+
+_celery_app = None
+
+
+def _get_celery_app():
+    """Resolve the Celery app once; imported lazily to keep app.core free of worker imports."""
+    global _celery_app
+    if _celery_app is None:
+        from app.worker.celery_app import celery_app
+
+        _celery_app = celery_app
+    return _celery_app
+
 
 class ExecutionMode(Enum):
     """Execution mode for service methods."""
@@ -34,6 +69,37 @@ class CircuitBreakerState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because its circuit breaker is OPEN."""
+
+
+class _TumbleLock:
+    """
+    Lock that retries a few non-blocking acquires before parking the thread.
+
+    Breaker transitions hold the lock for a handful of assignments, so a contending
+    thread usually gets it on a retry without a blocking wait.
+    """
+
+    __slots__ = ("_lock",)
+
+    _SPIN_ATTEMPTS = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        acquire = self._lock.acquire
+        for _ in range(self._SPIN_ATTEMPTS):
+            if acquire(blocking=False):
+                return self
+        acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
 class CircuitBreaker:
     """Simple circuit breaker for Celery tasks."""
 
@@ -55,18 +121,14 @@ class CircuitBreaker:
         self.state = CircuitBreakerState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self._lock = threading.Lock()
+        # time.monotonic() of the last failure; immune to wall-clock adjustments
+        self.last_failure_time: Optional[float] = None
+        # Only taken on state transitions; healthy successes never touch it
+        self._lock = _TumbleLock()
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function through circuit breaker."""
-        with self._lock:
-            if self.state == CircuitBreakerState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitBreakerState.HALF_OPEN
-                    logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise Exception("Circuit breaker is OPEN - service unavailable")
+        self._before_call()
 
         try:
             result = func(*args, **kwargs)
@@ -76,14 +138,45 @@ class CircuitBreaker:
             self._on_failure()
             raise
 
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Await a coroutine function through circuit breaker."""
+        self._before_call()
+
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except Exception:
+            self._on_failure()
+            raise
+
+    def _before_call(self) -> None:
+        """Reject the call while OPEN, or let a trial call through once recovery is due."""
+        # State is only read here; the lock is taken when an OPEN circuit may transition
+        if self.state is CircuitBreakerState.OPEN:
+            with self._lock:
+                if self.state is CircuitBreakerState.OPEN:
+                    if self._should_attempt_reset():
+                        self.state = CircuitBreakerState.HALF_OPEN
+                        logger.info("Circuit breaker entering HALF_OPEN state")
+                    else:
+                        raise CircuitBreakerOpenError(
+                            "Circuit breaker is OPEN - service unavailable"
+                        )
+
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to try reset."""
-        return self.last_failure_time is not None and datetime.now() - self.last_failure_time > timedelta(
-            seconds=self.recovery_timeout
+        return (
+            self.last_failure_time is not None
+            and time.monotonic() - self.last_failure_time > self.recovery_timeout
         )
 
     def _on_success(self):
         """Handle successful call."""
+        # Healthy closed circuit: nothing to reset, so skip the lock
+        if self.state is CircuitBreakerState.CLOSED and self.failure_count == 0:
+            return
+
         with self._lock:
             self.failure_count = 0
 
@@ -98,7 +191,7 @@ class CircuitBreaker:
         """Handle failed call."""
         with self._lock:
             self.failure_count += 1
-            self.last_failure_time = datetime.now()
+            self.last_failure_time = time.monotonic()
             self.success_count = 0
 
             if self.failure_count >= self.failure_threshold:
@@ -115,6 +208,24 @@ class CircuitBreaker:
             logger.info("Circuit breaker manually reset")
 
 
+class TaskConfig(NamedTuple):
+    """Routing for a service method registered as a Celery task."""
+
+    task_name: str
+    queue: str
+    priority: int
+
+
+class _PendingBatch:
+    """Task sends buffered for one (queue, priority) pair until the next flush."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self):
+        # (task_name, args, kwargs, future) per queued send
+        self.entries: List[Tuple[str, tuple, dict, Future]] = []
+
+
 class CeleryServiceWrapper:
     """
     Wrapper to make services work with Celery tasks.
@@ -128,6 +239,11 @@ class CeleryServiceWrapper:
         task_timeout: int = 300,
         result_ttl: int = 86400,
         use_circuit_breaker: bool = True,
+        worker_check_ttl: float = 5.0,
+        batch_max_size: int = 50,
+        batch_max_delay_ms: float = 0,
+        max_pending: int = 5000,
+        serializer: str = "json",
     ):
         """
         Initialize the service wrapper.
@@ -138,17 +254,58 @@ class CeleryServiceWrapper:
             task_timeout: Timeout for synchronous Celery tasks (seconds)
             result_ttl: Time to live for task results (seconds)
             use_circuit_breaker: Whether to use circuit breaker pattern
+            worker_check_ttl: How long a worker availability probe is reused (seconds)
+            batch_max_size: Queued sends that trigger an immediate batch flush; the
+                starting point for auto-tuning from the flusher's busy ratio
+            batch_max_delay_ms: How long a send may wait to be batched with others
+                (milliseconds); 0 sends every task immediately
+            max_pending: Batched sends allowed to wait for a flush before new ones are
+                rejected with BackpressureError
+            serializer: Kombu serializer for task messages; must be in the workers'
+                accept_content. Switch to "orjson" only once every worker registers it
         """
         self.service_name = service_name
         self.default_mode = default_mode
         self.task_timeout = task_timeout
         self.result_ttl = result_ttl
-        self._task_registry = {}
+        self.serializer = serializer
+        self._queued_count = itertools.count(1)
+        self._task_registry: Dict[str, TaskConfig] = {}
         self.use_circuit_breaker = use_circuit_breaker
 
         # Initialize circuit breakers per task
         self._circuit_breakers: Optional[Dict[str, CircuitBreaker]] = {} if use_circuit_breaker else None
 
+        # Bound once so queuing a task does not re-resolve the app on every send
+        self._celery_app = _get_celery_app()
+        self._send_task = self._celery_app.send_task
+        # Producers (and their broker connections) are checked out of the app's bounded pool
+        # explicitly, so one checkout can serve a whole batch
+        self._producer_pool = self._celery_app.producer_pool
+
+        # Last worker availability probe as (monotonic timestamp, available); the broadcast
+        # is refreshed in the background so sends never wait on it
+        self._worker_check_ttl = worker_check_ttl
+        self._worker_check_cache: Tuple[float, bool] = (0.0, True)
+        self._worker_check_lock = threading.Lock()
+        self._heartbeat_redis: Optional[redis.Redis] = None
+
+        # Fire-and-forget sends coalesced per (queue, priority) and published over one
+        # producer by a background flusher; disabled when batch_max_delay_ms is 0
+        self.batch_max_size = batch_max_size
+        self.batch_max_delay_ms = batch_max_delay_ms
+        self._pending_batches: Dict[Tuple[str, int], _PendingBatch] = {}
+        self.max_pending = max_pending
+        self._pending_count = 0
+        self._flush_efficiency: Optional[float] = None
+        self._last_flush_started: Optional[float] = None
+        self._batch_full = False
+        self._batch_cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+
+        # Async client on the result backend, created on first awaited result
+        self._result_redis: Optional[aioredis.Redis] = None
+
     def register_task(
         self, method_name: str, task_name: str, queue: str = "default", priority: int = 5
     ):
@@ -161,22 +318,21 @@ class CeleryServiceWrapper:
             queue: Queue to route the task to
             priority: Task priority
         """
-        self._task_registry[method_name] = {
-            "task_name": task_name,
-            "queue": queue,
-            "priority": priority,
-        }
-        logger.info(f"Registered task {task_name} for {self.service_name}.{method_name}")
+        self._task_registry[method_name] = TaskConfig(task_name, queue, priority)
+        # Created up front so dispatch only ever looks the breaker up
+        self._get_circuit_breaker(method_name)
+        logger.debug("Registered task %s for %s.%s", task_name, self.service_name, method_name)
 
     def _get_circuit_breaker(self, method_name: str) -> Optional[CircuitBreaker]:
         """Get or create circuit breaker for a method."""
-        if not self.use_circuit_breaker:
+        breakers = self._circuit_breakers
+        if breakers is None:
             return None
 
-        if self._circuit_breakers is not None and method_name not in self._circuit_breakers:
-            self._circuit_breakers[method_name] = CircuitBreaker()
-
-        return self._circuit_breakers[method_name] if self._circuit_breakers is not None else None
+        breaker = breakers.get(method_name)
+        if breaker is None:
+            breaker = breakers[method_name] = CircuitBreaker()
+        return breaker
 
     def execute(
         self, method_name: str, *args, mode: Optional[ExecutionMode] = None, **kwargs
@@ -195,24 +351,28 @@ class CeleryServiceWrapper:
         """
         execution_mode = mode or self.default_mode
 
-        if method_name not in self._task_registry:
+        task_config = self._task_registry.get(method_name)
+        if task_config is None:
             raise ValueError(f"Method {method_name} not registered for Celery execution")
 
-        task_config = self._task_registry[method_name]
         circuit_breaker = self._get_circuit_breaker(method_name)
 
         # For async mode, circuit breaker only checks if we can queue
-        if execution_mode == ExecutionMode.CELERY_ASYNC:
+        if execution_mode is ExecutionMode.CELERY_ASYNC:
             if circuit_breaker:
                 try:
-                    circuit_breaker.call(self._check_worker_availability)
+                    workers_available = circuit_breaker.call(self._check_worker_availability)
                 except Exception as e:
                     logger.error(f"Circuit breaker prevented task execution: {e}")
                     raise
+            else:
+                workers_available = self._check_worker_availability()
+            if not workers_available:
+                logger.warning(f"Queuing task {task_config.task_name} but no workers available")
             return self._execute_celery_async(task_config, *args, **kwargs)
 
         # For sync mode, circuit breaker wraps the entire execution
-        elif execution_mode == ExecutionMode.CELERY_SYNC:
+        elif execution_mode is ExecutionMode.CELERY_SYNC:
             if circuit_breaker:
                 return circuit_breaker.call(self._execute_celery_sync, task_config, *args, **kwargs)
             else:
@@ -220,68 +380,284 @@ class CeleryServiceWrapper:
         else:
             raise ValueError(f"Unsupported execution mode: {execution_mode}")
 
+    async def execute_async(
+        self, method_name: str, *args, mode: Optional[ExecutionMode] = None, **kwargs
+    ) -> Any:
+        """
+        Async counterpart of execute().
+
+        CELERY_SYNC results are awaited through the result backend's pub/sub channel
+        instead of blocking a thread while polling; other modes behave like execute().
+        """
+        execution_mode = mode or self.default_mode
+        if execution_mode != ExecutionMode.CELERY_SYNC:
+            return self.execute(method_name, *args, mode=execution_mode, **kwargs)
+
+        if method_name not in self._task_registry:
+            raise ValueError(f"Method {method_name} not registered for Celery execution")
+
+        task_config = self._task_registry[method_name]
+        circuit_breaker = self._get_circuit_breaker(method_name)
+        if circuit_breaker:
+            return await circuit_breaker.call_async(
+                self._execute_celery_sync_async, task_config, *args, **kwargs
+            )
+        return await self._execute_celery_sync_async(task_config, *args, **kwargs)
+
     def _check_worker_availability(self) -> bool:
-        """Check if Celery workers are available."""
+        """Check if Celery workers are available, using the last probe while it is fresh."""
+        checked_at, available = self._worker_check_cache
+        if time.monotonic() - checked_at >= self._worker_check_ttl:
+            self._refresh_worker_availability()
+        return available
+
+    def _refresh_worker_availability(self) -> None:
+        """Start a background probe unless one is already in flight."""
+        if not self._worker_check_lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self._worker_check_cache = (time.monotonic(), self._probe_worker_availability())
+            finally:
+                self._worker_check_lock.release()
+
+        threading.Thread(
+            target=refresh, name=f"{self.service_name}-worker-check", daemon=True
+        ).start()
+
+    def _probe_worker_availability(self) -> bool:
+        """Report whether any worker has an unexpired heartbeat in the result backend."""
         try:
-            from app.worker.celery_app import celery_app
-
-            inspect = celery_app.control.inspect()
-            active_workers = inspect.active_queues()
+            if self._heartbeat_redis is None:
+                self._heartbeat_redis = redis.from_url(self._celery_app.conf.result_backend)
 
-            if not active_workers:
+            # Members are scored by when their heartbeat lapses; one O(log n) count
+            live = self._heartbeat_redis.zcount(WORKER_HEARTBEATS_KEY, f"({time.time()}", "+inf")
+            if not live:
                 logger.warning("No active Celery workers found!")
                 return False
 
-            logger.debug(f"Found {len(active_workers)} active workers")
             return True
         except Exception as e:
             logger.error(f"Failed to check worker availability: {e}")
             return False
 
-    def _execute_celery_async(self, task_config: Dict[str, Any], *args, **kwargs) -> AsyncResult:
-        """Execute task asynchronously via Celery."""
-        from app.worker.celery_app import celery_app
+    def _execute_celery_async(
+        self, task_config: TaskConfig, *args, **kwargs
+    ) -> Union[AsyncResult, "Future[AsyncResult]"]:
+        """
+        Execute task asynchronously via Celery.
 
-        # Check worker availability before queuing
-        if not self._check_worker_availability():
-            logger.warning(f"Queuing task {task_config['task_name']} but no workers available")
+        Returns the AsyncResult, or a Future resolving to it when sends are batched.
+        """
+        if self.batch_max_delay_ms > 0:
+            return self._enqueue_batched(task_config, args, kwargs)
+
+        with self._producer_pool.acquire(block=True) as producer:
+            return self._publish(
+                task_config.task_name,
+                args,
+                kwargs,
+                task_config.queue,
+                task_config.priority,
+                producer=producer,
+            )
 
-        result = celery_app.send_task(
-            task_config["task_name"],
+    def _publish(
+        self, task_name: str, args: tuple, kwargs: dict, queue: str, priority: int, producer=None
+    ) -> AsyncResult:
+        """Send one task to the broker, optionally over an already acquired producer."""
+        result = self._send_task(
+            task_name,
             args=args,
             kwargs=kwargs,
-            queue=task_config["queue"],
-            priority=task_config["priority"],
+            queue=queue,
+            priority=priority,
             expires=self.result_ttl,
+            serializer=self.serializer,
+            producer=producer,
         )
 
-        logger.info(f"Queued task {task_config['task_name']} with ID {result.id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Queued task %s with ID %s", task_name, result.id)
+        queued = next(self._queued_count)
+        if queued % _QUEUED_LOG_INTERVAL == 0:
+            logger.info("%s has queued %d tasks", self.service_name, queued)
         return result
 
-    def _execute_celery_sync(self, task_config: Dict[str, Any], *args, **kwargs) -> Any:
+    def _enqueue_batched(self, task_config: TaskConfig, args: tuple, kwargs: dict) -> Future:
+        """Add a send to the pending batch for its queue and priority."""
+        future: Future = Future()
+        key = (task_config.queue, task_config.priority)
+        with self._batch_cond:
+            # Shed load instead of buffering without bound while the broker is slow
+            if self._pending_count >= self.max_pending:
+                raise BackpressureError(
+                    self.service_name, f"{self._pending_count} task sends already pending"
+                )
+            self._pending_count += 1
+
+            batch = self._pending_batches.get(key)
+            if batch is None:
+                batch = self._pending_batches[key] = _PendingBatch()
+            batch.entries.append((task_config.task_name, args, kwargs, future))
+            if len(batch.entries) >= self.batch_max_size:
+                self._batch_full = True
+            self._batch_cond.notify()
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name=f"{self.service_name}-batch-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+        return future
+
+    def _flush_loop(self) -> None:
+        """Publish pending batches once one is full or the oldest send has waited long enough."""
+        while True:
+            with self._batch_cond:
+                while not self._pending_batches:
+                    self._batch_cond.wait()
+
+                deadline = time.monotonic() + self.batch_max_delay_ms / 1000
+                while not self._batch_full:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._batch_cond.wait(remaining)
+
+                batches, self._pending_batches = self._pending_batches, {}
+                self._batch_full = False
+
+            started = time.monotonic()
+            flushed = 0
+            for (queue, priority), batch in batches.items():
+                self._publish_batch(queue, priority, batch.entries)
+                flushed += len(batch.entries)
+            self._tune_batch_size(started, time.monotonic() - started)
+
+            # Sends stay counted until published, so the bound also covers the batch in flight
+            with self._batch_cond:
+                self._pending_count -= flushed
+
+    def _tune_batch_size(self, started: float, duration: float) -> None:
+        """Adjust batch_max_size from the EMA of the flusher's busy ratio."""
+        last_started, self._last_flush_started = self._last_flush_started, started
+        if last_started is None or started <= last_started:
+            return
+
+        sample = min(duration / (started - last_started), 1.0)
+        ema = self._flush_efficiency
+        ema = sample if ema is None else ema + _BATCH_EMA_ALPHA * (sample - ema)
+        self._flush_efficiency = ema
+
+        if ema > _BATCH_GROW_ABOVE:
+            size = max(self.batch_max_size + 1, int(self.batch_max_size * 1.1))
+        elif ema < _BATCH_SHRINK_BELOW:
+            size = int(self.batch_max_size * 0.8)
+        else:
+            return
+        self.batch_max_size = max(_BATCH_SIZE_MIN, min(_BATCH_SIZE_MAX, size))
+
+    def _publish_batch(
+        self, queue: str, priority: int, entries: List[Tuple[str, tuple, dict, Future]]
+    ) -> None:
+        """Publish a batch over a single producer and resolve each send's future."""
+        try:
+            with self._producer_pool.acquire(block=True) as producer:
+                for task_name, args, kwargs, future in entries:
+                    try:
+                        future.set_result(
+                            self._publish(task_name, args, kwargs, queue, priority, producer=producer)
+                        )
+                    except Exception as e:
+                        future.set_exception(e)
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(entries)} tasks to {queue}: {e}")
+            for *_, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _execute_celery_sync(self, task_config: TaskConfig, *args, **kwargs) -> Any:
         """Execute task via Celery and wait for result."""
         from celery.exceptions import TaskRevokedError, TimeoutError
 
         result = self._execute_celery_async(task_config, *args, **kwargs)
+        if isinstance(result, Future):
+            result = result.result()
 
         try:
             # Wait for result with timeout
             return result.get(timeout=self.task_timeout)
         except TimeoutError:
-            logger.error(f"Task {task_config['task_name']} timed out after {self.task_timeout}s")
+            logger.error(f"Task {task_config.task_name} timed out after {self.task_timeout}s")
             # Attempt to revoke the task
             result.revoke(terminate=True)
             raise TimeoutError(f"Task {result.id} exceeded timeout of {self.task_timeout} seconds")
         except TaskRevokedError:
-            logger.error(f"Task {task_config['task_name']} was revoked")
+            logger.error(f"Task {task_config.task_name} was revoked")
             raise
         except Exception as e:
-            logger.error(f"Task {task_config['task_name']} failed: {e}", exc_info=True)
+            logger.error(f"Task {task_config.task_name} failed: {e}", exc_info=True)
             # Check if workers are available
             self._check_worker_availability()
             raise
 
 
+    async def _execute_celery_sync_async(self, task_config: TaskConfig, *args, **kwargs) -> Any:
+        """Execute task via Celery and await the result published by the backend."""
+        from celery.exceptions import TaskRevokedError, TimeoutError
+
+        result = self._execute_celery_async(task_config, *args, **kwargs)
+        if isinstance(result, Future):
+            result = await asyncio.wrap_future(result)
+
+        try:
+            meta = await asyncio.wait_for(self._await_task_meta(result.id), self.task_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Task {task_config.task_name} timed out after {self.task_timeout}s")
+            # Attempt to revoke the task
+            result.revoke(terminate=True)
+            raise TimeoutError(f"Task {result.id} exceeded timeout of {self.task_timeout} seconds")
+
+        if meta["status"] == states.SUCCESS:
+            return meta["result"]
+        if meta["status"] == states.REVOKED:
+            logger.error(f"Task {task_config.task_name} was revoked")
+            raise TaskRevokedError(result.id)
+
+        error = self._celery_app.backend.exception_to_python(meta["result"])
+        logger.error(f"Task {task_config.task_name} failed: {error}")
+        raise error
+
+    async def _await_task_meta(self, task_id: str) -> Dict[str, Any]:
+        """
+        Wait for a task to reach a ready state.
+
+        The Redis result backend publishes every state update on the task's meta key,
+        so one subscription replaces polling; the key is read once after subscribing in
+        case the task finished first.
+        """
+        if self._result_redis is None:
+            self._result_redis = aioredis.from_url(self._celery_app.conf.result_backend)
+        backend = self._celery_app.backend
+        key = backend.get_key_for_task(task_id)
+
+        async with self._result_redis.pubsub() as pubsub:
+            await pubsub.subscribe(key)
+            payload = await self._result_redis.get(key)
+            while True:
+                if payload is not None:
+                    meta = backend.decode_result(payload)
+                    if meta["status"] in states.READY_STATES:
+                        return meta
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                payload = message["data"] if message else None
+
+
 class ServiceProxy:
     """
     Proxy for service classes that routes method calls through Celery.
@@ -305,6 +681,20 @@ class ServiceProxy:
         self._wrapper = wrapper
         self._mode = mode
 
+        # Registered tasks get their routing closure up front; storing it in the instance
+        # dict means __getattr__ is never reached for them again
+        for name in wrapper._task_registry:
+            self.__dict__[name] = self._make_task_method(name)
+
+    def _make_task_method(self, name: str) -> Callable:
+        execute = self._wrapper.execute
+        mode = self._mode
+
+        def wrapped_method(*args, **kwargs):
+            return execute(name, *args, mode=mode, **kwargs)
+
+        return wrapped_method
+
     def __getattr__(self, name: str) -> Callable:
         """
         Intercept method calls and route through wrapper.
@@ -321,16 +711,33 @@ class ServiceProxy:
         if not callable(attr):
             return attr
 
-        # If it's a registered Celery task, wrap it
+        # If it's a registered Celery task, wrap it; otherwise call the method directly.
+        # Either way the callable is cached so later lookups skip __getattr__
         if name in self._wrapper._task_registry:
+            attr = self._make_task_method(name)
+        self.__dict__[name] = attr
+        return attr
 
-            def wrapped_method(*args, **kwargs):
-                return self._wrapper.execute(name, *args, mode=self._mode, **kwargs)
 
-            return wrapped_method
+# (module, owner class qualname) -> names of the owner's @celery_task methods; filled in by
+# the decorator at class definition so registration never has to scan an instance
+_celery_methods: Dict[Tuple[str, str], List[str]] = {}
+_celery_methods_by_type: "WeakKeyDictionary[type, Tuple[str, ...]]" = WeakKeyDictionary()
 
-        # Otherwise, call the method directly
-        return attr
+
+def _celery_method_names(cls: type) -> Tuple[str, ...]:
+    """Names of @celery_task methods defined on a class or its bases."""
+    names = _celery_methods_by_type.get(cls)
+    if names is None:
+        names = tuple(
+            dict.fromkeys(
+                name
+                for klass in cls.__mro__
+                for name in _celery_methods.get((klass.__module__, klass.__qualname__), ())
+            )
+        )
+        _celery_methods_by_type[cls] = names
+    return names
 
 
 def celery_task(
@@ -356,21 +763,42 @@ def celery_task(
             "priority": priority,
             "mode": mode,
         }
+        owner, _, name = func.__qualname__.rpartition(".")
+        if owner:
+            _celery_methods.setdefault((func.__module__, owner), []).append(name)
         return func
 
     return decorator
 
 
+@dataclass(slots=True)
+class _ServiceEntry:
+    """A registered service together with its Celery wrapper and proxy."""
+
+    instance: Any
+    wrapper: CeleryServiceWrapper
+    proxy: ServiceProxy
+
+
 class CeleryServiceManager:
     """
     Manager for all Celery-enabled services.
     """
 
-    def __init__(self):
-        """Initialize the service manager."""
-        self._services = {}
-        self._wrappers = {}
-        self._proxies = {}
+    # Inspect commands reported by get_queue_stats, each a broadcast to every worker
+    _QUEUE_STAT_COMMANDS = ("active_queues", "scheduled", "active", "reserved", "stats")
+
+    def __init__(self, queue_stats_ttl: float = 2.0):
+        """
+        Initialize the service manager.
+
+        Args:
+            queue_stats_ttl: How long a queue statistics snapshot is reused (seconds)
+        """
+        self._entries: Dict[str, _ServiceEntry] = {}
+        self._queue_stats_ttl = queue_stats_ttl
+        # (monotonic timestamp, snapshot); replaced wholesale, so readers need no lock
+        self._queue_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
     def register_service(
         self,
@@ -393,9 +821,10 @@ class CeleryServiceManager:
         wrapper = CeleryServiceWrapper(service_name=service_name, default_mode=default_mode)
 
         # Auto-register methods with @celery_task decorator
-        for method_name in dir(service_instance):
+        for method_name in _celery_method_names(type(service_instance)):
             if not method_name.startswith("_"):
                 method = getattr(service_instance, method_name)
+                # A subclass may override a decorated method without the decorator
                 if hasattr(method, "_celery_config"):
                     config = method._celery_config
                     wrapper.register_task(
@@ -409,9 +838,7 @@ class CeleryServiceManager:
         proxy = ServiceProxy(service_instance=service_instance, wrapper=wrapper, mode=default_mode)
 
         # Store references
-        self._services[service_name] = service_instance
-        self._wrappers[service_name] = wrapper
-        self._proxies[service_name] = proxy
+        self._entries[service_name] = _ServiceEntry(service_instance, wrapper, proxy)
 
         logger.info(f"Registered service {service_name} with Celery manager")
 
@@ -427,9 +854,10 @@ class CeleryServiceManager:
         Returns:
             ServiceProxy for the service
         """
-        if service_name not in self._proxies:
+        entry = self._entries.get(service_name)
+        if entry is None:
             raise ValueError(f"Service {service_name} not registered")
-        return self._proxies[service_name]
+        return entry.proxy
 
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
@@ -441,9 +869,7 @@ class CeleryServiceManager:
         Returns:
             Task status information
         """
-        from app.worker.celery_app import celery_app
-
-        result = AsyncResult(task_id, app=celery_app)
+        result = AsyncResult(task_id, app=_get_celery_app())
 
         return {
             "task_id": task_id,
@@ -463,9 +889,7 @@ class CeleryServiceManager:
         Returns:
             True if task was cancelled
         """
-        from app.worker.celery_app import celery_app
-
-        result = AsyncResult(task_id, app=celery_app)
+        result = AsyncResult(task_id, app=_get_celery_app())
         result.revoke(terminate=True)
 
         logger.info(f"Cancelled task {task_id}")
@@ -478,17 +902,19 @@ class CeleryServiceManager:
         Returns:
             Queue statistics
         """
-        from app.worker.celery_app import celery_app
-
-        inspect = celery_app.control.inspect()
-
-        return {
-            "active_queues": inspect.active_queues(),
-            "scheduled": inspect.scheduled(),
-            "active": inspect.active(),
-            "reserved": inspect.reserved(),
-            "stats": inspect.stats(),
-        }
+        cached = self._queue_stats_cache
+        if cached is not None and time.monotonic() - cached[0] < self._queue_stats_ttl:
+            return cached[1]
+
+        # The broadcasts are independent, so they run concurrently rather than back to back
+        inspect = _get_celery_app().control.inspect()
+        commands = self._QUEUE_STAT_COMMANDS
+        with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+            results = pool.map(lambda command: getattr(inspect, command)(), commands)
+            stats = dict(zip(commands, results))
+
+        self._queue_stats_cache = (time.monotonic(), stats)
+        return stats
 
 
 # Global service manager instance
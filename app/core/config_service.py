@@ -4,18 +4,45 @@ Enhanced configuration service with validation and hierarchical organization.
 
 import logging
 import os
+import re
 from enum import StrEnum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Type, TypeVar
 
-from pydantic import Field, SecretStr, field_validator
+from dotenv import load_dotenv
+from pydantic import Field, PrivateAttr, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .service_interface import HealthCheckResult, ServiceInterface, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+_CSV_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated env value, dropping blanks and surrounding whitespace"""
+    return [item for item in _CSV_SEPARATOR.split(value.strip()) if item]
+
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+def _build_settings(settings_cls: Type[SettingsT]) -> SettingsT:
+    """
+    Instantiate a settings class, skipping env parsing and validation when none of its
+    variables are set (the defaults are valid by construction).
+    """
+    env_names = {
+        field.validation_alias.upper()
+        for field in settings_cls.model_fields.values()
+        if isinstance(field.validation_alias, str)
+    }
+    if env_names.isdisjoint(name.upper() for name in os.environ):
+        return settings_cls.model_construct()
+    return settings_cls()
+
 
 class OpenAIConfig(BaseSettings):
     """OpenAI-specific configuration"""
@@ -42,7 +69,7 @@ class QdrantConfig(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="QDRANT_")
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Construct Qdrant URL"""
         return f"http://{self.host}:{self.port}"
@@ -58,17 +85,20 @@ class PostgresConfig(BaseSettings):
     password: SecretStr = Field(default=SecretStr("postgres"), validation_alias="POSTGRES_PASSWORD")
     pool_size: int = Field(default=10, validation_alias="POSTGRES_POOL_SIZE")
     max_overflow: int = Field(default=20, validation_alias="POSTGRES_MAX_OVERFLOW")
+    statement_cache_size: int = Field(
+        default=1024, validation_alias="POSTGRES_STATEMENT_CACHE_SIZE"
+    )
 
     model_config = SettingsConfigDict(env_prefix="POSTGRES_")
 
-    @property
+    @cached_property
     def async_url(self) -> str:
         """Construct async PostgreSQL URL"""
         user = self.user.get_secret_value()
         password = self.password.get_secret_value()
         return f"postgresql+asyncpg://{user}:{password}@{self.host}:{self.port}/{self.database}"
 
-    @property
+    @cached_property
     def sync_url(self) -> str:
         """Construct sync PostgreSQL URL"""
         user = self.user.get_secret_value()
@@ -83,10 +113,12 @@ class RedisConfig(BaseSettings):
     port: int = Field(default=6379, validation_alias="REDIS_PORT")
     db: int = Field(default=0, validation_alias="REDIS_DB")
     password: Optional[SecretStr] = Field(default=SecretStr("redis"), validation_alias="REDIS_PASSWORD")
+    # Conversations kept in process memory while Redis is unavailable
+    fallback_cache_size: int = Field(default=10_000, validation_alias="REDIS_FALLBACK_CACHE_SIZE")
 
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
-    @property
+    @cached_property
     def url(self) -> str:
         """Construct Redis URL"""
         if self.password:
@@ -94,24 +126,33 @@ class RedisConfig(BaseSettings):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+_DEFAULT_SECRET_KEY = "secret"
+
+
 class SecurityConfig(BaseSettings):
     """Security-related configuration"""
 
-    secret_key: SecretStr = Field(default=SecretStr("secret"), validation_alias="SECRET_KEY")
+    secret_key: SecretStr = Field(default=SecretStr(_DEFAULT_SECRET_KEY), validation_alias="SECRET_KEY")
     algorithm: str = Field(default="HS256", validation_alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, validation_alias="REFRESH_TOKEN_EXPIRE_DAYS")
     registration_enabled: bool = Field(default=True, validation_alias="REGISTRATION_ENABLED")
     registration_keys: List[str] = Field(default_factory=list, validation_alias="REGISTRATION_SECRET_KEYS")
+    bcrypt_target_ms: int = Field(default=250, validation_alias="BCRYPT_TARGET_MS")
 
     model_config = SettingsConfigDict(env_prefix="")
 
     @field_validator("registration_keys", mode="before")
     def parse_registration_keys(cls, v):
         if isinstance(v, str):
-            return [key.strip() for key in v.split(",") if key.strip()]
+            return _split_csv(v)
         return v
 
+    @cached_property
+    def registration_key_set(self) -> FrozenSet[str]:
+        """Registration keys as a set for constant-time membership checks"""
+        return frozenset(self.registration_keys)
+
 
 class StorageConfig(BaseSettings):
     """File storage configuration"""
@@ -126,10 +167,15 @@ class StorageConfig(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="STORAGE_")
 
+    # Directories already created by get_path, so repeat calls skip the mkdir syscall
+    _ensured_paths: set[Path] = PrivateAttr(default_factory=set)
+
     def get_path(self, subdir: str) -> Path:
         """Get full path for a subdirectory"""
         path = self.base_dir / subdir
-        path.mkdir(parents=True, exist_ok=True)
+        if path not in self._ensured_paths:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_paths.add(path)
         return path
 
 
@@ -140,16 +186,28 @@ class EnvironmentEnum(StrEnum):
     TEST = "test"
 
 
+# Only needed to pick the env file before settings are parsed; the field itself is
+# resolved by pydantic-settings
 global_environment: EnvironmentEnum = EnvironmentEnum(
     os.getenv("ENVIRONMENT", EnvironmentEnum.DEVELOPMENT.value)
 )
 
+# Read the env file into os.environ once, so every settings class resolves from the
+# process environment instead of parsing the file itself. Real env vars take precedence.
+load_dotenv(
+    ".env" if global_environment != EnvironmentEnum.TEST else ".env.test",
+    override=False,
+    encoding="utf-8",
+)
+
 
 class AppConfig(BaseSettings):
     """Main application configuration"""
 
     name: str = Field(default="AI Paralegal POC", validation_alias="APP_NAME")
-    environment: EnvironmentEnum = Field(default=global_environment, validation_alias="ENVIRONMENT")
+    environment: EnvironmentEnum = Field(
+        default=EnvironmentEnum.DEVELOPMENT, validation_alias="ENVIRONMENT"
+    )
     debug: bool = Field(default=True, validation_alias="DEBUG")
     log_level: str = Field(default="DEBUG", validation_alias="LOG_LEVEL")
     cors_origins: List[str] = Field(default_factory=lambda: ["*"], validation_alias="CORS_ORIGINS")
@@ -157,25 +215,16 @@ class AppConfig(BaseSettings):
     port: int = Field(default=8000, validation_alias="PORT")
     reload: bool = Field(default=True, validation_alias="RELOAD")
 
-    # Sub-configurations
-    openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
-    qdrant: QdrantConfig = Field(default_factory=QdrantConfig)
-    postgres: PostgresConfig = Field(default_factory=PostgresConfig)
-    redis: RedisConfig = Field(default_factory=RedisConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    storage: StorageConfig = Field(default_factory=StorageConfig)
-
     model_config = SettingsConfigDict(
-        env_file=".env" if global_environment != EnvironmentEnum.TEST else ".env.test",
-        env_file_encoding="utf-8",
         case_sensitive=False,
+        env_ignore_empty=True,
         extra="ignore",
     )
 
     @field_validator("cors_origins", mode="before")
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
+            return _split_csv(v)
         return v
 
     @field_validator("environment")
@@ -185,6 +234,31 @@ class AppConfig(BaseSettings):
             raise ValueError(f"Environment must be one of {allowed}")
         return v
 
+    # Sub-configurations, each read from the environment on first access only
+    @cached_property
+    def openai(self) -> OpenAIConfig:
+        return _build_settings(OpenAIConfig)
+
+    @cached_property
+    def qdrant(self) -> QdrantConfig:
+        return _build_settings(QdrantConfig)
+
+    @cached_property
+    def postgres(self) -> PostgresConfig:
+        return _build_settings(PostgresConfig)
+
+    @cached_property
+    def redis(self) -> RedisConfig:
+        return _build_settings(RedisConfig)
+
+    @cached_property
+    def security(self) -> SecurityConfig:
+        return _build_settings(SecurityConfig)
+
+    @cached_property
+    def storage(self) -> StorageConfig:
+        return _build_settings(StorageConfig)
+
 
 class ConfigService(ServiceInterface):
     """
@@ -233,10 +307,7 @@ class ConfigService(ServiceInterface):
         # Check required secrets in production
         config = self.config
         if config.environment == "production":
-            if (
-                config.security.secret_key.get_secret_value()
-                == "dev-secret-key-change-in-production"
-            ):
+            if config.security.secret_key.get_secret_value() == _DEFAULT_SECRET_KEY:
                 raise ValueError("SECRET_KEY must be changed in production")
 
             if not config.openai.api_key.get_secret_value():
@@ -274,18 +345,13 @@ class ConfigService(ServiceInterface):
         """Reload configuration (useful for testing)"""
         ConfigService._config = self._load_config()
         self._validate_config()
+        # Drop the memoized snapshot so get_config() returns the reloaded values
+        get_config.cache_clear()
         logger.info("Configuration reloaded")
 
 
-# Singleton instance
-_config_service_instance: Optional[ConfigService] = None
-
-
 # Convenience function for accessing config
 @lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Get current configuration (cached singleton)"""
-    global _config_service_instance
-    if _config_service_instance is None:
-        _config_service_instance = ConfigService()
-    return _config_service_instance.config
+    return ConfigService().config
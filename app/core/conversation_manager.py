@@ -2,26 +2,68 @@
 Conversation state management with Redis support.
 """
 
-import json
 import logging
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Annotated, Any, Dict, List, Optional, cast
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple, cast
 
+import orjson
 import redis.asyncio as redis
 from fastapi import Depends, Request
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    bindparam,
+    column,
+    func,
+    not_,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import select
 
 from ..models import Case, ResponseHistory
 from .config_service import ConfigService
 from .database_manager import DatabaseManager
+from .performance_utils import AsyncCache
 from .service_interface import HealthCheckResult, ServiceInterface, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+# Redis key prefixes for cached state and for ids known to have no stored history.
+# The version segment changes whenever the cached payload format does.
+_KEY_PREFIX = b"conv:v2:"
+_NEGATIVE_KEY_PREFIX = b"conv:neg:"
+# Upper bound on pooled Redis sockets shared by concurrent requests
+_REDIS_MAX_CONNECTIONS = 64
+# How long a conversation id with no stored history skips the database lookup
+_NEGATIVE_CACHE_TTL_SECONDS = 60
+# Process-local copy of recently decoded cache payloads. Redis is still read every time;
+# the local copy only saves decoding when Redis holds the same payload.
+_LOCAL_CACHE_MAX_SIZE = 1000
+_LOCAL_CACHE_TTL = timedelta(seconds=60)
+# Every "metadata" object in a response input, whether it is a single message or a list
+# (lax mode wraps a bare object for [*])
+_INPUT_METADATA_PATH = '$[*].metadata ? (@.type() == "object")'
 
-@dataclass
+
+def _make_key(conversation_id: str) -> bytes:
+    """Redis key holding the cached state of a conversation"""
+    return _KEY_PREFIX + conversation_id.encode()
+
+
+def _make_negative_key(conversation_id: str) -> bytes:
+    """Redis key marking a conversation id as absent from the database"""
+    return _NEGATIVE_KEY_PREFIX + conversation_id.encode()
+
+
+@dataclass(slots=True)
 class ConversationState:
     """State of a conversation"""
 
@@ -32,6 +74,43 @@ class ConversationState:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Snapshot of the fields as last cached, so a bare touch can skip the rewrite
+    _saved: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # Cache key encoded once, handed to redis-py as-is
+    _key: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._key = _make_key(self.conversation_id)
+
+    def _snapshot(self) -> Tuple[Any, ...]:
+        # Metadata is compared serialized since callers mutate the dict in place
+        return (
+            self.last_response_id,
+            self.case_id,
+            self.user_id,
+            self.created_at,
+            orjson.dumps(self.metadata),
+        )
+
+    def mark_saved(self) -> None:
+        """Record the current contents as matching the cached copy"""
+        self._saved = self._snapshot()
+
+    def only_touched(self) -> bool:
+        """Whether nothing but updated_at changed since the last save"""
+        return self._saved is not None and self._saved == self._snapshot()
+
+    def clone_saved(self) -> "ConversationState":
+        """
+        Independent copy of a saved state. Metadata is rebuilt from the saved snapshot,
+        so the copy shares no mutable objects and needs no re-serialization.
+        """
+        saved = cast(Tuple[Any, ...], self._saved)
+        clone = ConversationState(
+            self.conversation_id, *saved[:4], self.updated_at, orjson.loads(saved[4])
+        )
+        clone._saved = saved
+        return clone
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -47,17 +126,58 @@ class ConversationState:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationState":
-        """Create from dictionary"""
+        """Create from dictionary; timestamps may be ISO 8601 strings or datetimes"""
+        get = data.get
+        created_at = data["created_at"]
+        updated_at = data["updated_at"]
         return cls(
-            conversation_id=data["conversation_id"],
-            last_response_id=data.get("last_response_id"),
-            case_id=data.get("case_id"),
-            user_id=data.get("user_id"),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            metadata=data.get("metadata", {}),
+            data["conversation_id"],
+            get("last_response_id"),
+            get("case_id"),
+            get("user_id"),
+            created_at if isinstance(created_at, datetime) else datetime.fromisoformat(created_at),
+            updated_at if isinstance(updated_at, datetime) else datetime.fromisoformat(updated_at),
+            get("metadata") or {},
+        )
+
+    def to_cache(self) -> bytes:
+        """
+        Serialize for the Redis cache: short keys and epoch timestamps keep the payload
+        small and avoid ISO formatting/parsing.
+        """
+        return orjson.dumps(
+            {
+                "c": self.conversation_id,
+                "r": self.last_response_id,
+                "k": self.case_id,
+                "u": self.user_id,
+                "ca": self.created_at.timestamp(),
+                "ua": self.updated_at.timestamp(),
+                "m": self.metadata,
+            }
         )
 
+    @classmethod
+    def from_cache(cls, payload: bytes) -> "ConversationState":
+        """Rebuild from a payload produced by to_cache"""
+        data = orjson.loads(payload)
+        fromtimestamp = datetime.fromtimestamp
+        return cls(
+            data["c"],
+            data["r"],
+            data["k"],
+            data["u"],
+            fromtimestamp(data["ca"]),
+            fromtimestamp(data["ua"]),
+            data["m"],
+        )
+
+
+# Cache writes deferred by ConversationManager.batched_writes(), keyed by Redis key
+_pending_writes: ContextVar[Optional[Dict[bytes, ConversationState]]] = ContextVar(
+    "pending_conversation_writes", default=None
+)
+
 
 class ConversationManager(ServiceInterface):
     """
@@ -70,13 +190,97 @@ class ConversationManager(ServiceInterface):
         self._db_manager = db_manager
         self._redis_client: Optional[redis.Redis] = None
         self._cache_ttl = timedelta(hours=24)  # Conversation cache TTL
+        # LRU-bounded so the fallback cannot grow without limit
+        self._memory_cache = AsyncCache(
+            max_size=self._config.redis.fallback_cache_size, default_ttl=self._cache_ttl
+        )
+        # Payload -> decoded state; callers get clones so they never share an object
+        self._local_cache = AsyncCache(max_size=_LOCAL_CACHE_MAX_SIZE, default_ttl=_LOCAL_CACHE_TTL)
+        self._build_queries()
+
+    def _build_queries(self) -> None:
+        """
+        Build the hot SELECTs once, with bind parameters for everything that varies.
+        Reusing the same statement objects lets SQLAlchemy skip rebuilding the clause
+        tree and recomputing its cache key on every call.
+        """
+        id_col = cast(Any, ResponseHistory.id)
+        thread_id_col = cast(Any, ResponseHistory.thread_id)
+        created_at_col = cast(Any, ResponseHistory.created_at)
+        history_columns = (
+            id_col,
+            cast(Any, ResponseHistory.response_id),
+            cast(Any, ResponseHistory.input),
+            cast(Any, ResponseHistory.output),
+            created_at_col,
+        )
+        limit = bindparam("limit", type_=Integer)
+
+        # Pick the newest rows, then let the database return them oldest-first
+        latest = (
+            select(*history_columns)
+            .where(thread_id_col == bindparam("thread_id"))
+            .order_by(created_at_col.desc(), id_col.desc())
+            .limit(limit)
+            .subquery()
+        )
+        self._q_history_latest = select(latest).order_by(
+            latest.c.created_at.asc(), latest.c.id.asc()
+        )
+        self._q_history_after = (
+            select(*history_columns)
+            .where(
+                thread_id_col == bindparam("thread_id"),
+                tuple_(created_at_col, id_col)
+                > tuple_(
+                    bindparam("after_created_at", type_=DateTime),
+                    bindparam("after_id", type_=String),
+                ),
+            )
+            .order_by(created_at_col.asc(), id_col.asc())
+            .limit(limit)
+        )
+
+        self._q_latest_state = (
+            select(
+                cast(Any, ResponseHistory.response_id),
+                created_at_col,
+                self._merged_input_metadata(),
+            )
+            .where(thread_id_col == bindparam("thread_id"))
+            .order_by(created_at_col.desc())
+            .limit(1)
+        )
+        # DISTINCT ON keeps the latest response per thread
+        self._q_latest_states = (
+            select(
+                thread_id_col,
+                cast(Any, ResponseHistory.response_id),
+                created_at_col,
+                self._merged_input_metadata(),
+            )
+            .where(thread_id_col.in_(bindparam("thread_ids", expanding=True)))
+            .order_by(thread_id_col, created_at_col.desc())
+            .distinct(thread_id_col)
+        )
+
+        self._q_case_conversations = select(cast(Any, Case.conversation_ids)).where(
+            cast(Any, Case.id) == bindparam("case_id")
+        )
+        # Answered from the created_at index that INCLUDEs thread_id
+        self._q_expired_count = select(func.count(func.distinct(thread_id_col))).where(
+            created_at_col < bindparam("cutoff", type_=DateTime)
+        )
 
     async def _initialize_impl(self) -> None:
         """Initialize Redis connection"""
         try:
-            self._redis_client = await redis.from_url(
-                self._config.redis.url, encoding="utf-8", decode_responses=True
+            pool = redis.ConnectionPool.from_url(
+                self._config.redis.url,
+                max_connections=_REDIS_MAX_CONNECTIONS,
+                decode_responses=False,
             )
+            self._redis_client = redis.Redis.from_pool(pool)
             # Test connection
             if self._redis_client is not None:
                 await self._redis_client.ping()
@@ -84,7 +288,6 @@ class ConversationManager(ServiceInterface):
         except Exception as e:
             logger.warning(f"Redis not available, using in-memory cache: {e}")
             self._redis_client = None
-            self._memory_cache: Dict[str, ConversationState] = {}
 
     async def _shutdown_impl(self) -> None:
         """Cleanup resources"""
@@ -104,11 +307,14 @@ class ConversationManager(ServiceInterface):
                 details["redis"] = "disconnected"
         else:
             details["redis"] = "not configured"
+            # Evictions show whether the in-memory fallback is sized for the load
+            details["memory_cache"] = self._memory_cache.get_metrics()
 
         # Check database
         try:
-            async with self._db_manager.get_session() as session:
-                await session.execute(select(ResponseHistory).limit(1))
+            # Plain pooled connection and SELECT 1: no ORM session or row hydration
+            async with self._db_manager.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
             details["database"] = "connected"
         except:
             details["database"] = "error"
@@ -126,16 +332,25 @@ class ConversationManager(ServiceInterface):
         self, conversation_id: str, user_id: Optional[str] = None, case_id: Optional[str] = None
     ) -> ConversationState:
         """Get existing conversation or create new one"""
-        # Try cache first
-        state = await self._get_from_cache(conversation_id)
+        # A write still buffered by batched_writes() is newer than anything in Redis
+        pending = _pending_writes.get()
+        if pending:
+            state = pending.get(_make_key(conversation_id))
+            if state is not None:
+                return state
+
+        # Try cache first, refreshing the TTL in the same round-trip
+        state, known_missing = await self._get_and_touch(conversation_id)
         if state:
             return state
 
-        # Check database
-        state = await self._get_from_db(conversation_id)
-        if state:
-            await self._save_to_cache(state)
-            return state
+        # Check database, unless it recently had nothing for this id
+        if not known_missing:
+            state = await self._get_from_db(conversation_id)
+            if state:
+                await self._save_to_cache(state)
+                return state
+            await self._mark_missing(conversation_id)
 
         # Create new
         state = ConversationState(conversation_id=conversation_id, user_id=user_id, case_id=case_id)
@@ -172,38 +387,81 @@ class ConversationManager(ServiceInterface):
             session.add(history)
             await session.commit()
 
+        # The conversation now has history, so stop short-circuiting its DB lookup
+        if self._redis_client:
+            try:
+                await self._redis_client.unlink(_make_negative_key(conversation_id))
+            except Exception as e:
+                logger.error(f"Redis delete error: {e}")
+
     async def get_conversation_history(
-        self, conversation_id: str, limit: int = 10
+        self,
+        conversation_id: str,
+        limit: int = 10,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get conversation history from database"""
-        async with self._db_manager.get_session() as session:
-            thread_id_col = cast(Any, ResponseHistory.thread_id)
-            created_at_col = cast(Any, ResponseHistory.created_at)
-
-            result = await session.execute(
-                select(ResponseHistory)
-                .where(thread_id_col == conversation_id)
-                .order_by(created_at_col.desc())
-                .limit(limit)
-            )
+        """
+        Get conversation history from database, oldest first.
+
+        Without ``after`` this returns the latest ``limit`` responses. To page forward,
+        pass the ``(created_at, id)`` of the last row already seen; the keyset predicate
+        stays an index range scan however deep the page is, unlike OFFSET.
+        """
+        params: Dict[str, Any] = {"thread_id": conversation_id, "limit": limit}
+        if after is None:
+            stmt = self._q_history_latest
+        else:
+            stmt = self._q_history_after
+            params["after_created_at"], params["after_id"] = after
+
+        async with self._db_manager.read_session() as session:
+            result = await session.stream(stmt, params)
+
+            now_iso = datetime.utcnow().isoformat()
+            return [
+                {
+                    "id": row_id,
+                    "response_id": response_id,
+                    "input": input_value,
+                    "output": output,
+                    "created_at": created_at.isoformat() if created_at is not None else now_iso,
+                }
+                async for row_id, response_id, input_value, output, created_at in result
+            ]
+
+    async def get_many_conversations(
+        self, conversation_ids: List[str]
+    ) -> Dict[str, ConversationState]:
+        """
+        Get many existing conversations with a constant number of round-trips: one MGET,
+        then one query for whatever the cache missed. Unknown ids are left out.
+        """
+        ids = list(dict.fromkeys(conversation_ids))
+        states: Dict[str, ConversationState] = {}
+        if not ids:
+            return states
 
-            history = []
-            for record in reversed(result.scalars().all()):
-                created_at_value = cast(Optional[datetime], getattr(record, "created_at", None))
-                history.append(
-                    {
-                        "response_id": record.response_id,
-                        "input": record.input,
-                        "output": record.output,
-                        "created_at": (
-                            created_at_value.isoformat()
-                            if created_at_value is not None
-                            else datetime.utcnow().isoformat()
-                        ),
-                    }
-                )
+        if self._redis_client:
+            try:
+                payloads = await self._redis_client.mget([_make_key(cid) for cid in ids])
+                for cid, data in zip(ids, payloads):
+                    if data:
+                        states[cid] = self._decode_cached(data)
+            except Exception as e:
+                logger.error(f"Redis get error: {e}")
+        else:
+            for cid in ids:
+                state = await self._memory_cache.get(cid)
+                if state:
+                    states[cid] = state
 
-            return history
+        missing = [cid for cid in ids if cid not in states]
+        if missing:
+            stored = await self._get_many_from_db(missing)
+            await self._save_many_to_cache(list(stored.values()))
+            states.update(stored)
+
+        return states
 
     async def link_to_case(self, conversation_id: str, case_id: str) -> None:
         """Link conversation to a case"""
@@ -211,143 +469,279 @@ class ConversationManager(ServiceInterface):
         state.case_id = case_id
         await self.update_conversation(state)
 
-        # Update case with conversation reference
+        # Append to the case in one atomic UPDATE; the row lock plus the containment
+        # check keep concurrent links from duplicating or losing ids
+        conversation_ids_col = cast(Any, Case.conversation_ids)
         async with self._db_manager.get_session() as session:
-            case_id_col = cast(Any, Case.id)
-            result = await session.execute(select(Case).where(case_id_col == case_id))
-            case = result.scalar_one_or_none()
-
-            if case:
-                # Case model does not define a JSON metadata field; skipping persistence.
-                pass
+            await session.execute(
+                update(Case)
+                .where(cast(Any, Case.id) == case_id)
+                .where(not_(conversation_ids_col.contains([conversation_id])))
+                .values(
+                    conversation_ids=conversation_ids_col.op("||", return_type=JSONB)(
+                        func.jsonb_build_array(conversation_id)
+                    )
+                )
+            )
 
     async def get_case_conversations(self, case_id: str) -> List[str]:
         """Get all conversation IDs linked to a case"""
-        async with self._db_manager.get_session() as session:
-            case_id_col = cast(Any, Case.id)
-            result = await session.execute(select(Case).where(case_id_col == case_id))
-            _ = result.scalar_one_or_none()
-            return []
+        async with self._db_manager.read_session() as session:
+            result = await session.execute(self._q_case_conversations, {"case_id": case_id})
+            return result.scalar_one_or_none() or []
 
     async def cleanup_expired_conversations(
         self, older_than: timedelta = timedelta(days=30)
     ) -> int:
-        """Clean up old conversations"""
-        cutoff_date = datetime.now() - older_than
+        """
+        Count conversations with history older than ``older_than``.
 
-        async with self._db_manager.get_session() as session:
-            # Get expired conversations
-            thread_id_col = cast(Any, ResponseHistory.thread_id)
-            created_at_col = cast(Any, ResponseHistory.created_at)
-
-            result = await session.execute(
-                select(thread_id_col).where(created_at_col < cutoff_date).distinct()
-            )
+        Nothing needs evicting: every cache write sets the entry's TTL, so Redis drops
+        idle conversations by itself. History stays in the database.
+        """
+        cutoff_date = datetime.now() - older_than
 
-            expired_ids = [row[0] for row in result]
+        async with self._db_manager.read_session() as session:
+            result = await session.execute(self._q_expired_count, {"cutoff": cutoff_date})
+            expired_count = result.scalar_one()
 
-            if expired_ids:
-                # Delete from cache
-                for conv_id in expired_ids:
-                    await self._delete_from_cache(conv_id)
+        if expired_count:
+            logger.info(f"Found {expired_count} expired conversations; their cache entries expire")
+        return expired_count
 
-                # Note: Not deleting from database to preserve history
-                logger.info(f"Cleaned up {len(expired_ids)} expired conversations from cache")
+    # Cache operations
+    @staticmethod
+    def _decode_cached(data: bytes) -> ConversationState:
+        """Rebuild a state from its cached payload"""
+        state = ConversationState.from_cache(data)
+        state.mark_saved()
+        return state
 
-            return len(expired_ids)
+    async def _decode_current(self, conversation_id: str, data: bytes) -> ConversationState:
+        """
+        Decode a payload just read from Redis, reusing the local copy only if it was made
+        from the same payload. Another worker's write changes the payload, so it is
+        never masked by this process's copy.
+        """
+        entry = await self._local_cache.get(conversation_id)
+        if entry is not None and entry[0] == data:
+            return entry[1].clone_saved()
+        state = self._decode_cached(data)
+        await self._local_cache.set(conversation_id, (data, state.clone_saved()))
+        return state
 
-    # Cache operations
     async def _get_from_cache(self, conversation_id: str) -> Optional[ConversationState]:
         """Get conversation from cache"""
         if self._redis_client:
             try:
-                data = await self._redis_client.get(f"conv:{conversation_id}")
+                data = await self._redis_client.get(_make_key(conversation_id))
                 if data:
-                    return ConversationState.from_dict(json.loads(data))
+                    return await self._decode_current(conversation_id, data)
             except Exception as e:
                 logger.error(f"Redis get error: {e}")
         else:
             # In-memory fallback
-            return self._memory_cache.get(conversation_id)
+            return await self._memory_cache.get(conversation_id)
 
         return None
 
-    async def _save_to_cache(self, state: ConversationState) -> None:
-        """Save conversation to cache"""
+    async def _get_and_touch(
+        self, conversation_id: str
+    ) -> Tuple[Optional[ConversationState], bool]:
+        """
+        Get conversation from cache and refresh its TTL in one pipelined call.
+
+        Also reports whether the id is negatively cached, i.e. the database had no
+        history for it on a recent lookup.
+        """
+        if not self._redis_client:
+            return await self._get_from_cache(conversation_id), False
+
+        key = _make_key(conversation_id)
+        try:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.expire(key, self._cache_ttl)
+                pipe.exists(_make_negative_key(conversation_id))
+                data, _, known_missing = await pipe.execute()
+            if data:
+                return await self._decode_current(conversation_id, data), False
+            return None, bool(known_missing)
+        except Exception as e:
+            logger.error(f"Redis get error: {e}")
+
+        return None, False
+
+    async def _mark_missing(self, conversation_id: str) -> None:
+        """Remember briefly that the database has no history for a conversation"""
         if self._redis_client:
             try:
                 await self._redis_client.setex(
-                    f"conv:{state.conversation_id}", self._cache_ttl, json.dumps(state.to_dict())
+                    _make_negative_key(conversation_id), _NEGATIVE_CACHE_TTL_SECONDS, b"1"
                 )
             except Exception as e:
                 logger.error(f"Redis set error: {e}")
+
+    @asynccontextmanager
+    async def batched_writes(self) -> AsyncIterator[None]:
+        """
+        Defer conversation cache writes made inside the block and flush them together.
+
+        Meant for request handlers that touch several conversations: N updates cost one
+        Redis pipeline instead of N round-trips. Reads through get_or_create_conversation
+        see the buffered states.
+        """
+        if _pending_writes.get() is not None:
+            # Already buffering; the outermost block flushes
+            yield
+            return
+
+        pending: Dict[bytes, ConversationState] = {}
+        token = _pending_writes.set(pending)
+        try:
+            yield
+        finally:
+            _pending_writes.reset(token)
+            await self._save_many_to_cache(list(pending.values()))
+
+    async def _save_to_cache(self, state: ConversationState) -> None:
+        """Save conversation to cache"""
+        if self._redis_client:
+            pending = _pending_writes.get()
+            if pending is not None:
+                pending[state._key] = state
+                return
+            await self._save_many_to_cache([state])
         else:
             # In-memory fallback
-            self._memory_cache[state.conversation_id] = state
+            await self._memory_cache.set(state.conversation_id, state)
+
+    async def _save_many_to_cache(self, states: List[ConversationState]) -> None:
+        """Save conversations to cache in a single pipelined round-trip"""
+        if not states:
+            return
+        if not self._redis_client:
+            for state in states:
+                await self._memory_cache.set(state.conversation_id, state)
+            return
+
+        # Only the timestamp moved: refresh the TTL instead of rewriting the value
+        touched: List[ConversationState] = []
+        changed: List[ConversationState] = []
+        for state in states:
+            (touched if state.only_touched() else changed).append(state)
+        try:
+            written = [(state, state.to_cache()) for state in changed]
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for state in touched:
+                    pipe.expire(state._key, self._cache_ttl)
+                for state, payload in written:
+                    pipe.setex(state._key, self._cache_ttl, payload)
+                results = await pipe.execute()
+
+            # Keys that expired meanwhile need the full value written back
+            expired = [state for state, refreshed in zip(touched, results) if not refreshed]
+            if expired:
+                rewritten = [(state, state.to_cache()) for state in expired]
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for state, payload in rewritten:
+                        pipe.setex(state._key, self._cache_ttl, payload)
+                    await pipe.execute()
+                written += rewritten
+
+            for state, payload in written:
+                state.mark_saved()
+                await self._local_cache.set(state.conversation_id, (payload, state.clone_saved()))
+        except Exception as e:
+            logger.error(f"Redis set error: {e}")
 
     async def _delete_from_cache(self, conversation_id: str) -> None:
         """Delete conversation from cache"""
         if self._redis_client:
+            await self._local_cache.delete(conversation_id)
             try:
-                await self._redis_client.delete(f"conv:{conversation_id}")
+                await self._redis_client.delete(_make_key(conversation_id))
             except Exception as e:
                 logger.error(f"Redis delete error: {e}")
         else:
             # In-memory fallback
-            self._memory_cache.pop(conversation_id, None)
+            await self._memory_cache.delete(conversation_id)
+
+    @staticmethod
+    def _merged_input_metadata() -> Any:
+        """
+        Correlated subquery merging every metadata object in ResponseHistory.input, so
+        Postgres sends back only the result instead of the whole input document.
+        """
+        metadata_objs = func.jsonb_path_query(
+            cast(Any, ResponseHistory.input), _INPUT_METADATA_PATH
+        ).table_valued(column("obj", JSONB), name="metadata_objs")
+        pairs = (
+            func.jsonb_each(metadata_objs.c.obj)
+            .table_valued("key", column("value", JSONB), name="pairs")
+            .lateral()
+        )
+        return (
+            select(func.jsonb_object_agg(pairs.c.key, pairs.c.value, type_=JSONB))
+            .select_from(metadata_objs.join(pairs, true()))
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _state_from_row(
+        conversation_id: str,
+        response_id: str,
+        created_at: Optional[datetime],
+        metadata: Optional[Dict[str, Any]],
+    ) -> ConversationState:
+        """Build a state from the latest response row of a conversation"""
+        ts = created_at or datetime.utcnow()
+        return ConversationState(
+            conversation_id=conversation_id,
+            last_response_id=response_id,
+            created_at=ts,
+            updated_at=ts,
+            metadata=metadata or {},
+        )
 
     async def _get_from_db(self, conversation_id: str) -> Optional[ConversationState]:
         """Reconstruct conversation state from database"""
-        async with self._db_manager.get_session() as session:
+        async with self._db_manager.read_session() as session:
             # Get latest response
-            thread_id_col = cast(Any, ResponseHistory.thread_id)
-            created_at_col = cast(Any, ResponseHistory.created_at)
-
-            result = await session.execute(
-                select(ResponseHistory)
-                .where(thread_id_col == conversation_id)
-                .order_by(created_at_col.desc())
-                .limit(1)
-            )
+            result = await session.execute(self._q_latest_state, {"thread_id": conversation_id})
 
-            latest = result.scalar_one_or_none()
+            latest = result.one_or_none()
             if latest:
-                # Try to extract metadata from responses
-                metadata: Dict[str, Any] = {}
-
-                input_value: Dict[str, Any] | List[Any] = cast(Any, latest.input)
-
-                if isinstance(input_value, dict):
-                    m = input_value.get("metadata")
-                    if isinstance(m, dict):
-                        metadata.update(m)
-                elif isinstance(input_value, list):
-                    for item in cast(List[Any], input_value):
-                        if isinstance(item, dict):
-                            m = item.get("metadata")
-                            if isinstance(m, dict):
-                                metadata.update(m)
-
-                ts = latest.created_at or datetime.utcnow()
-
-                return ConversationState(
-                    conversation_id=conversation_id,
-                    last_response_id=latest.response_id,
-                    created_at=ts,
-                    updated_at=ts,
-                    metadata=metadata,
-                )
+                return self._state_from_row(conversation_id, *latest)
 
         return None
 
+    async def _get_many_from_db(self, conversation_ids: List[str]) -> Dict[str, ConversationState]:
+        """Reconstruct many conversation states from the database in one query"""
+        async with self._db_manager.read_session() as session:
+            result = await session.execute(self._q_latest_states, {"thread_ids": conversation_ids})
+
+            return {
+                thread_id: self._state_from_row(thread_id, *rest)
+                for thread_id, *rest in result
+            }
+
     @asynccontextmanager
     async def conversation_context(self, conversation_id: str):
-        """Context manager for conversation operations"""
-        state = await self.get_or_create_conversation(conversation_id)
-        try:
-            yield state
-        finally:
-            await self.update_conversation(state)
+        """
+        Context manager for conversation operations.
+
+        Cache writes made while the block runs, including saving a newly created state,
+        are queued and sent in one Redis pipeline on exit.
+        """
+        async with self.batched_writes():
+            state = await self.get_or_create_conversation(conversation_id)
+            try:
+                yield state
+            finally:
+                # Unchanged state is already cached and its TTL was refreshed on read
+                if not state.only_touched():
+                    await self.update_conversation(state)
 
 
 def get_conversation_manager(request: Request) -> ConversationManager:
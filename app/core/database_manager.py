@@ -4,8 +4,9 @@ Enhanced database management with connection pooling and unit of work pattern.
 
 import logging
 from contextlib import asynccontextmanager
-from typing import Annotated, AsyncGenerator, Optional
+from typing import Annotated, Any, AsyncGenerator, Optional
 
+import orjson
 from fastapi import Depends, Request
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
@@ -23,6 +24,11 @@ from .service_interface import HealthCheckResult, ServiceInterface, ServiceStatu
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(value: Any) -> str:
+    """JSON serializer for the async engine; asyncpg's jsonb codec expects text."""
+    return orjson.dumps(value).decode()
+
+
 class DatabaseManager(ServiceInterface):
     """
     Manages database connections with proper pooling and lifecycle management.
@@ -33,6 +39,7 @@ class DatabaseManager(ServiceInterface):
         self._async_engine: Optional[AsyncEngine] = None
         self._sync_engine: Optional[Engine] = None
         self._async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._sync_session_factory: Optional[sessionmaker[Session]] = None
         self._config = config_service.config
         self._initialized = False
@@ -47,6 +54,16 @@ class DatabaseManager(ServiceInterface):
             max_overflow=self._config.postgres.max_overflow,
             pool_pre_ping=True,  # Verify connections before using
             pool_recycle=3600,
+            # Room for every distinct compiled statement the services issue
+            query_cache_size=2048,
+            # JSONB columns are (de)serialized by orjson instead of the stdlib json module
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            connect_args={
+                "prepared_statement_cache_size": self._config.postgres.statement_cache_size,
+                # Short OLTP queries never benefit from JIT but pay its planning overhead
+                "server_settings": {"jit": "off"},
+            },
         )
 
         # Create sync engine for migrations and scripts
@@ -63,6 +80,10 @@ class DatabaseManager(ServiceInterface):
         self._async_session_factory = async_sessionmaker(
             self._async_engine, class_=AsyncSession, expire_on_commit=False
         )
+        # Nothing is ever pending in a read session, so skip the autoflush checks
+        self._read_session_factory = async_sessionmaker(
+            self._async_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
 
         from sqlalchemy.orm import sessionmaker
 
@@ -139,8 +160,20 @@ ORDER BY table_name;"""
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
+
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get an async session for SELECT-only work.
+
+        No commit is issued; closing the session hands the connection back to the pool,
+        which ends the read transaction.
+        """
+        if not self._read_session_factory:
+            raise RuntimeError("Database not initialized")
+
+        async with self._read_session_factory() as session:
+            yield session
 
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[AsyncSession, None]:
@@ -257,7 +290,10 @@ def _log_connection_close(dbapi_conn, connection_record):
 
 
 def get_database_manager(request: Request) -> DatabaseManager:
-    return request.app.state.manager.inject_service(DatabaseManager)
+    db_manager = getattr(request.app.state, "db_manager", None)
+    if db_manager is None:
+        db_manager = request.app.state.manager.inject_service(DatabaseManager)
+    return db_manager
 
 
 DatabaseManagerDep = Annotated[DatabaseManager, Depends(get_database_manager)]
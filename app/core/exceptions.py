@@ -47,6 +47,12 @@ class ServiceUnavailableError(ServiceError):
     pass
 
 
+class BackpressureError(ServiceUnavailableError):
+    """Raised when a service's local submission queue is full and new work is shed"""
+
+    pass
+
+
 class ToolError(ParalegalException):
     """Base class for tool execution errors"""
 
@@ -4,7 +4,7 @@ Performance optimization utilities for the AI Paralegal system.
 
 import asyncio
 import hashlib
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import wraps
@@ -32,16 +32,20 @@ class CacheEntry:
 
 class AsyncCache:
     """
-    Async-safe cache with TTL support and metrics.
+    Async-safe LRU cache with TTL support and metrics.
+
+    Entries are kept in recency order, so lookups, inserts and evictions are all O(1).
+    Expired entries are dropped when read or when they reach the LRU end.
     """
 
     def __init__(self, max_size: int = 1000, default_ttl: timedelta = timedelta(minutes=15)):
-        self._cache: Dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._lock = asyncio.Lock()
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
@@ -57,6 +61,7 @@ class AsyncCache:
                 self._misses += 1
                 return None
 
+            self._cache.move_to_end(key)
             entry.hits += 1
             self._hits += 1
             return entry.value
@@ -64,27 +69,30 @@ class AsyncCache:
     async def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> None:
         """Set value in cache"""
         async with self._lock:
-            # Evict oldest entries if at capacity
-            if len(self._cache) >= self._max_size:
-                # Remove expired entries first
-                expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-                for k in expired_keys:
-                    del self._cache[k]
-
-                # If still over capacity, remove least recently used
-                if len(self._cache) >= self._max_size:
-                    lru_key = min(self._cache.items(), key=lambda x: x[1].hits)[0]
-                    del self._cache[lru_key]
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                # Evict the least recently used entry; dropping an expired one is not
+                # counted as an eviction
+                _, evicted = self._cache.popitem(last=False)
+                if not evicted.is_expired:
+                    self._evictions += 1
 
             expires_at = datetime.now() + (ttl or self._default_ttl)
             self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
 
+    async def delete(self, key: str) -> None:
+        """Remove a single entry from cache"""
+        async with self._lock:
+            self._cache.pop(key, None)
+
     async def clear(self) -> None:
         """Clear all cache entries"""
         async with self._lock:
             self._cache.clear()
             self._hits = 0
             self._misses = 0
+            self._evictions = 0
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get cache metrics"""
@@ -98,6 +106,7 @@ class AsyncCache:
             "misses": self._misses,
             "hit_rate": hit_rate,
             "total_requests": total_requests,
+            "evictions": self._evictions,
         }
 
 
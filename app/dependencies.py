@@ -7,5 +7,8 @@ from app.core.database_manager import DatabaseManager
 
 
 async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
-    async with request.app.state.manager.inject_service(DatabaseManager).get_session() as session:
+    db_manager = getattr(request.app.state, "db_manager", None)
+    if db_manager is None:
+        db_manager = request.app.state.manager.inject_service(DatabaseManager)
+    async with db_manager.get_session() as session:
         yield session
@@ -21,7 +21,7 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
-from .auth import get_current_active_user
+from .auth import calibrate_bcrypt_rounds, get_current_active_user
 from .core.config_service import ConfigService
 from .core.conversation_manager import ConversationManager
 from .core.database_manager import DatabaseManager
@@ -47,9 +47,6 @@ from .services import (
     SupremeCourtService,
 )
 
-# Get log level and format from environment variables
-LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
-JSON_LOGS = os.getenv("LOG_FORMAT", "json") == "json"
 USE_CELERY = os.getenv("USE_CELERY", "false").lower() == "true"
 
 # Import Celery components if enabled
@@ -153,8 +150,12 @@ async def lifespan(app: FastAPI):
                 logger.info("LIFESPAN: Initializing lifecycle manager...")
                 app.state.manager = initialize_services()
                 await app.state.manager.startup()
+                # Resolved once so per-request dependencies skip the container lookup
+                app.state.db_manager = app.state.manager.inject_service(DatabaseManager)
                 logger.info("LIFESPAN: Lifecycle manager initialization complete.")
 
+                await asyncio.to_thread(calibrate_bcrypt_rounds)
+
                 # Initialize agent
                 logger.info("LIFESPAN: Initializing agent...")
                 app.state.agent = ParalegalAgentSDK(
@@ -4,7 +4,8 @@ from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, Column, Engine, String
+from sqlalchemy import JSON, Column, Engine, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 from typing_extensions import TypedDict
 
@@ -79,8 +80,8 @@ class FormTemplateBase(SQLModel):
 class ResponseHistoryBase(SQLModel):
     thread_id: str
     response_id: str
-    input: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    output: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    input: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    output: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
     previous_response_id: Optional[str] = Field(default=None)
 
 
@@ -118,6 +119,21 @@ class SNRulingBase(SQLModel):
 
 class ResponseHistory(ResponseHistoryBase, table=True):
     __tablename__ = "response_history"  # type: ignore
+    __table_args__ = (
+        # Lets conversation cleanup find expired threads with an index-only scan
+        Index(
+            "ix_response_history_created_at",
+            "created_at",
+            postgresql_include=["thread_id"],
+        ),
+        # Serves latest-N history reads and keyset paging within a thread
+        Index(
+            "ix_response_history_thread_id_created_at_id",
+            "thread_id",
+            "created_at",
+            "id",
+        ),
+    )
     id: Optional[str] = Field(default_factory=generate_uuid, primary_key=True)
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(
@@ -134,6 +150,9 @@ class Case(CaseBase, table=True):
     )
     closed_at: Optional[datetime] = Field(default=None)
     created_by_id: Optional[str] = Field(default=None, foreign_key="users.id")
+    conversation_ids: List[str] = Field(
+        default=[], sa_column=Column(JSONB, nullable=False, server_default="[]")
+    )
 
     documents: List["Document"] = Relationship(back_populates="case")
     deadlines: List["Deadline"] = Relationship(back_populates="case")
@@ -222,7 +241,7 @@ class UserRole(str, Enum):
     CLIENT = "client"
 
 class UserBase(SQLModel):
-    email: str = Field(unique=True, index=True)
+    email: str
     full_name: str
     role: UserRole = Field(default=UserRole.CLIENT)
     is_active: bool = Field(default=True)
@@ -231,6 +250,15 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users"  # type: ignore
+    __table_args__ = (
+        # The only index on email: enforces uniqueness and covers the login lookup
+        Index(
+            "ix_users_email_covering",
+            "email",
+            unique=True,
+            postgresql_include=["hashed_password", "is_active", "id", "role"],
+        ),
+    )
     id: str = Field(default_factory=generate_uuid, primary_key=True)
     hashed_password: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -252,9 +280,9 @@ class User(UserBase, table=True):
 class UserSession(SQLModel, table=True):
     __tablename__ = "user_sessions"  # type: ignore
     id: Optional[str] = Field(default_factory=generate_uuid, primary_key=True)
-    user_id: str = Field(foreign_key="users.id")
+    user_id: str = Field(foreign_key="users.id", index=True)
     token: str = Field(unique=True, index=True)
-    expires_at: datetime
+    expires_at: datetime = Field(index=True)
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
 
     user: User = Relationship(back_populates="sessions")
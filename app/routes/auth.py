@@ -7,30 +7,48 @@ import secrets
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
+import jwt
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr
-from sqlmodel import Session, select
-from sqlmodel import func
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select
 
 from ..auth import (
+    authenticate_password,
     create_access_token,
     create_session_token,
+    decode_token,
     get_current_active_user,
     get_current_user,
     get_password_hash,
+    invalidate_cached_user,
+    password_needs_rehash,
+    require_admin,
     verify_password,
 )
 from ..core.config_service import get_config
-from ..core.database_manager import DatabaseManager
 from ..core.logger_manager import correlation_context, get_logger, set_user_id
+from ..core.performance_utils import AsyncCache
+from ..dependencies import get_db
 from ..models import User, UserRole, UserSession
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/api/auth", tags=["Authentication"])
+router = APIRouter(
+    prefix="/api/auth", tags=["Authentication"], default_response_class=ORJSONResponse
+)
 config = get_config()
 
+# Token lifetimes are fixed for the lifetime of the process
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=config.security.access_token_expire_minutes)
+_REFRESH_TOKEN_EXPIRES = timedelta(days=config.security.refresh_token_expire_days)
+_ACCESS_TOKEN_EXPIRES_IN = int(_ACCESS_TOKEN_EXPIRES.total_seconds())
+
+# Planner estimate of the users table size, shared across admin polls
+_user_count_cache = AsyncCache(max_size=1, default_ttl=timedelta(seconds=30))
+
 
 # Request/Response models
 class UserRegister(BaseModel):
@@ -87,23 +105,11 @@ class RegistrationKeyResponse(BaseModel):
     created_at: datetime
 
 
-def require_admin() -> User:
-    """Dependency to require admin role."""
-    def check_admin(current_user: User = Depends(get_current_active_user)) -> User:
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Admin access required"
-            )
-        return current_user
-    return Depends(check_admin)
-
-
 @router.post("/register", response_model=UserResponse)
 async def register(
     user_data: UserRegister, 
     request: Request,
-    session: Session = Depends(DatabaseManager.get_session)
+    session: AsyncSession = Depends(get_db),
 ):
     """Register a new user."""
     with correlation_context():
@@ -127,23 +133,24 @@ async def register(
                 )
 
             # Validate secret key
-            valid_keys = config.security.registration_keys
-            if user_data.secret_key not in valid_keys:
+            if user_data.secret_key not in config.security.registration_key_set:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN, 
                     detail="Invalid registration key"
                 )
 
             # Check if user already exists
-            existing_user = session.exec(select(User).where(User.email == user_data.email)).first()
-            if existing_user:
+            existing_user_id = (
+                await session.execute(select(User.id).where(User.email == user_data.email))
+            ).scalar_one_or_none()
+            if existing_user_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST, 
                     detail="Email already registered"
                 )
 
             # Create new user
-            hashed_password = get_password_hash(user_data.password)
+            hashed_password = await get_password_hash(user_data.password)
             new_user = User(
                 email=user_data.email,
                 full_name=user_data.full_name,
@@ -151,8 +158,8 @@ async def register(
             )
 
             session.add(new_user)
-            session.commit()
-            session.refresh(new_user)
+            await session.commit()
+            await session.refresh(new_user)
 
             # Ensure user was properly created
             if new_user.id is None or new_user.created_at is None:
@@ -202,7 +209,7 @@ async def register(
 async def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(DatabaseManager.get_session),
+    session: AsyncSession = Depends(get_db),
 ):
     """Login and receive access and refresh tokens."""
     with correlation_context():
@@ -217,10 +224,20 @@ async def login(
             },
         )
 
-        # Find user by email
-        user = session.exec(select(User).where(User.email == form_data.username)).first()
+        # Only the columns in ix_users_email_covering, so Postgres can answer
+        # the lookup with an index-only scan
+        credentials = (
+            await session.execute(
+                select(User.id, User.hashed_password, User.is_active, User.role).where(
+                    User.email == form_data.username
+                )
+            )
+        ).one_or_none()
 
-        if not user or not verify_password(form_data.password, user.hashed_password):
+        password_ok = await authenticate_password(
+            form_data.password, credentials.hashed_password if credentials else None
+        )
+        if not credentials or not password_ok:
             logger.warning(
                 f"Login failed: invalid credentials for {form_data.username}",
                 extra={
@@ -237,18 +254,31 @@ async def login(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        if not user.is_active:
+        if not credentials.is_active:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, 
                 detail="User account is inactive"
             )
 
+        # The full row is only loaded for a verified, active login
+        user = await session.get(User, credentials.id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect email or password",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Upgrade hashes created with a lower cost than the calibrated one
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await get_password_hash(form_data.password)
+
         # Update last login
         user.last_login = datetime.now(UTC)
         session.add(user)
 
         # Create access token
-        access_token_expires = timedelta(minutes=config.security.access_token_expire_minutes)
+        access_token_expires = _ACCESS_TOKEN_EXPIRES
         access_token = create_access_token(
             data={
                 "sub": str(user.id),
@@ -260,7 +290,7 @@ async def login(
         )
 
         # Create refresh token (longer lived)
-        refresh_token_expires = timedelta(days=7)  # 7 days for refresh token
+        refresh_token_expires = _REFRESH_TOKEN_EXPIRES
         refresh_token = create_access_token(
             data={
                 "sub": str(user.id),
@@ -285,7 +315,7 @@ async def login(
             expires_at=datetime.now(UTC) + access_token_expires
         )
         session.add(user_session)
-        session.commit()
+        await session.commit()
 
         set_user_id(request, str(user.id))
         logger.info(
@@ -303,24 +333,20 @@ async def login(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="bearer",
-            expires_in=config.security.access_token_expire_minutes * 60,
+            expires_in=_ACCESS_TOKEN_EXPIRES_IN,
         )
 
 
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     token_data: RefreshTokenRequest,
-    session: Session = Depends(DatabaseManager.get_session),
+    session: AsyncSession = Depends(get_db),
 ):
     """Refresh access token using refresh token."""
     with correlation_context():
         try:
             # Decode refresh token
-            payload = jwt.decode(
-                token_data.refresh_token,
-                config.security.secret_key.get_secret_value(),
-                algorithms=[config.security.algorithm],
-            )
+            payload = decode_token(token_data.refresh_token)
             
             # Validate token type
             if payload.get("type") != "refresh":
@@ -337,7 +363,7 @@ async def refresh_token(
                 )
                 
             # Get user
-            user = session.get(User, user_id)
+            user = await session.get(User, user_id)
             if not user or not user.is_active:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -345,7 +371,7 @@ async def refresh_token(
                 )
 
             # Create new tokens
-            access_token_expires = timedelta(minutes=config.security.access_token_expire_minutes)
+            access_token_expires = _ACCESS_TOKEN_EXPIRES
             access_token = create_access_token(
                 data={
                     "sub": str(user.id),
@@ -357,7 +383,7 @@ async def refresh_token(
             )
 
             # Create new refresh token
-            refresh_token_expires = timedelta(days=7)
+            refresh_token_expires = _REFRESH_TOKEN_EXPIRES
             new_refresh_token = create_access_token(
                 data={
                     "sub": str(user.id),
@@ -377,10 +403,10 @@ async def refresh_token(
                 access_token=access_token,
                 refresh_token=new_refresh_token,
                 token_type="bearer",
-                expires_in=config.security.access_token_expire_minutes * 60,
+                expires_in=_ACCESS_TOKEN_EXPIRES_IN,
             )
 
-        except JWTError:
+        except jwt.PyJWTError:
             logger.error(
                 "Token refresh failed: invalid token",
                 extra={"extra_fields": {"event": "token_refresh_error", "error": "invalid_token"}},
@@ -403,19 +429,13 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(DatabaseManager.get_session),
+    session: AsyncSession = Depends(get_db),
 ):
     """Logout the current user by invalidating their sessions."""
     with correlation_context():
-        # Delete all user sessions
-        user_sessions = session.exec(
-            select(UserSession).where(UserSession.user_id == current_user.id)
-        ).all()
-
-        for user_session in user_sessions:
-            session.delete(user_session)
-
-        session.commit()
+        # Delete all user sessions in a single statement
+        await session.execute(delete(UserSession).where(UserSession.user_id == current_user.id))  # type: ignore
+        await session.commit()
 
         logger.info(
             f"User logged out: {current_user.email}",
@@ -455,7 +475,7 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
 async def update_current_user(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    session: Session = Depends(DatabaseManager.get_session),
+    session: AsyncSession = Depends(get_db),
 ):
     """Update current user's profile (limited fields)."""
     # For security, users can only update their full_name
@@ -472,8 +492,9 @@ async def update_current_user(
 
     current_user.updated_at = datetime.now(UTC)
     session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    await session.commit()
+    await invalidate_cached_user(current_user.id)
+    await session.refresh(current_user)
 
     return UserResponse(
         id=str(current_user.id),
@@ -490,21 +511,22 @@ async def update_current_user(
 async def change_password(
     password_data: PasswordChangeRequest,
     current_user: User = Depends(get_current_active_user),
-    session: Session = Depends(DatabaseManager.get_session),
+    session: AsyncSession = Depends(get_db),
 ):
     """Change current user's password."""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
 
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await get_password_hash(password_data.new_password)
     current_user.updated_at = datetime.now(UTC)
     session.add(current_user)
-    session.commit()
+    await session.commit()
+    await invalidate_cached_user(current_user.id)
 
     logger.info(
         f"Password changed successfully for: {current_user.email}",
@@ -536,30 +558,53 @@ async def verify_token(current_user: User = Depends(get_current_user)):
 async def get_all_users(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = require_admin(),
-    session: Session = Depends(DatabaseManager.get_session),
+    exact: bool = False,
+    current_user: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_db),
 ):
-    """Get all users (admin only)."""
-    # Get total count
-    total_users = session.exec(select(func.count()).select_from(User)).one()
-
-    # Get users with pagination
-    users = session.exec(
-        select(User).offset(skip).limit(limit).order_by(User.created_at.desc())  # type: ignore
-    ).all()
-
-    user_responses = [
-        UserResponse(
-            id=str(user.id),
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role.value,
-            is_active=user.is_active,
-            is_verified=user.is_verified,
-            created_at=user.created_at,
+    """Get all users (admin only).
+
+    The total is the planner's row estimate unless ``exact`` is requested,
+    which avoids a full-table COUNT(*) on every page load.
+    """
+    # Get users with pagination, selecting only the response columns to skip ORM hydration
+    rows = (
+        await session.execute(
+            select(
+                User.id,
+                User.email,
+                User.full_name,
+                User.role,
+                User.is_active,
+                User.is_verified,
+                User.created_at,
+            )
+            .order_by(User.created_at.desc())  # type: ignore
+            .offset(skip)
+            .limit(limit)
         )
-        for user in users
-    ]
+    ).mappings().all()
+
+    # Get total count
+    total_users: Optional[int] = None
+    if not exact:
+        total_users = await _user_count_cache.get("users")
+        if total_users is None:
+            estimate = (
+                await session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'users'")
+                )
+            ).scalar()
+            # reltuples is -1 until the table has been analyzed
+            if estimate is not None and estimate >= 0:
+                total_users = int(estimate)
+                await _user_count_cache.set("users", total_users)
+    if total_users is None:
+        total_users = (await session.execute(select(func.count()).select_from(User))).scalar_one()
+    else:
+        total_users = max(total_users, skip + len(rows))
+
+    user_responses = [UserResponse(**{**row, "role": row["role"].value}) for row in rows]
 
     return UserListResponse(users=user_responses, total=total_users)
 
@@ -568,11 +613,11 @@ async def get_all_users(
 async def update_user(
     user_id: str,
     user_update: UserUpdate,
-    current_user: User = require_admin(),
-    session: Session = Depends(DatabaseManager.get_session),
+    current_user: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_db),
 ):
     """Update user details (admin only)."""
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -588,8 +633,9 @@ async def update_user(
 
     user.updated_at = datetime.now(UTC)
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await invalidate_cached_user(user.id)
+    await session.refresh(user)
 
     return UserResponse(
         id=str(user.id),
@@ -605,11 +651,11 @@ async def update_user(
 @router.delete("/admin/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: str,
-    current_user: User = require_admin(),
-    session: Session = Depends(DatabaseManager.get_session),
+    current_user: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_db),
 ):
     """Delete a user (admin only)."""
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -620,12 +666,13 @@ async def delete_user(
             detail="Cannot delete your own account"
         )
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
+    await invalidate_cached_user(user_id)
 
 
 @router.post("/admin/registration-keys/generate", response_model=RegistrationKeyResponse)
-async def generate_registration_key(current_user: User = require_admin()):
+async def generate_registration_key(current_user: User = Depends(require_admin)):
     """Generate a new registration secret key (admin only)."""
     import string
     
@@ -637,7 +684,7 @@ async def generate_registration_key(current_user: User = require_admin()):
 
 
 @router.get("/admin/registration-keys/status")
-async def get_registration_status(current_user: User = require_admin()):
+async def get_registration_status(current_user: User = Depends(require_admin)):
     """Get current registration configuration status (admin only)."""
     # Get current keys but mask them for security
     valid_keys = config.security.registration_keys
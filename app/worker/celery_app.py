@@ -4,7 +4,9 @@ Celery application with comprehensive monitoring, error handling, and structured
 
 import os
 
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
 from app.core.logger_manager import get_logger
 from app.worker.config import CeleryConfig
@@ -19,6 +21,15 @@ configure_celery_logging(
 
 logger = get_logger(__name__)
 
+# orjson-backed task serializer; must be registered in producers and workers alike
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Create Celery app with configuration
 celery_app = Celery("ai_paralegal_worker")
 celery_app.config_from_object(CeleryConfig)
@@ -13,6 +13,12 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from app.core.config_service import ConfigService
 
+# Workers add themselves to this sorted set on every heartbeat (see monitoring), scored by
+# when that heartbeat lapses; producers count unexpired members instead of broadcasting an
+# inspect request to the fleet or scanning the keyspace
+WORKER_HEARTBEATS_KEY = "celery:workers:heartbeats"
+WORKER_HEARTBEAT_TTL = 30  # seconds; several missed heartbeats before a worker counts as gone
+
 
 class CeleryConfig:
     """Centralized Celery configuration for all workers."""
@@ -23,10 +29,13 @@ class CeleryConfig:
     # Broker settings - use ConfigService for Redis URL
     broker_url = _config_service.config.redis.url
     result_backend = _config_service.config.redis.url
+    # Producers shared by request threads, batch flushers and workers publishing subtasks
+    broker_pool_limit = 16
 
-    # Serialization
+    # Serialization - json by default; orjson (registered in celery_app) and msgpack are
+    # accepted for producers that opt into faster encodings
     task_serializer = "json"
-    accept_content = ["json"]
+    accept_content = ["json", "orjson", "msgpack"]
     result_serializer = "json"
     timezone = "UTC"
     enable_utc = True
@@ -167,6 +176,11 @@ class CeleryConfig:
             "schedule": timedelta(minutes=5),
             "options": {"queue": "high_priority"},
         },
+        "cleanup-expired-sessions": {
+            "task": "worker.tasks.maintenance.cleanup_expired_sessions",
+            "schedule": timedelta(minutes=5),
+            "options": {"queue": "default"},
+        },
         "process-dead-letters": {
             "task": "worker.tasks.maintenance.process_dead_letter_queue",
             "schedule": timedelta(hours=1),
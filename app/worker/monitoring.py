@@ -3,6 +3,7 @@ Comprehensive Celery monitoring with signals, metrics, and error tracking.
 """
 
 import json
+import time
 from collections import defaultdict, deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
@@ -12,6 +13,7 @@ from typing import Any, Dict, List, Optional
 import redis
 from celery.signals import (  # Worker signals; Task signals; Beat signals; Event signals
     before_task_publish,
+    heartbeat_sent,
     task_failure,
     task_postrun,
     task_prerun,
@@ -29,6 +31,7 @@ from celery.signals import (  # Worker signals; Task signals; Beat signals; Even
 
 from app.core.config_service import ConfigService
 from app.core.logger_manager import get_logger
+from app.worker.config import WORKER_HEARTBEAT_TTL, WORKER_HEARTBEATS_KEY
 
 logger = get_logger(__name__)
 
@@ -155,6 +158,7 @@ class CeleryMonitor:
         worker_process_init.connect(self.on_worker_process_init)
         worker_process_shutdown.connect(self.on_worker_process_shutdown)
         worker_shutting_down.connect(self.on_worker_shutting_down)
+        heartbeat_sent.connect(self.on_heartbeat_sent)
 
         # Task lifecycle signals
         task_prerun.connect(self.on_task_prerun)
@@ -187,6 +191,7 @@ class CeleryMonitor:
         )
 
         logger.info(f"Worker ready: {hostname} (PID: {pid})")
+        self._mark_worker_alive(hostname)
         self._store_metric(
             "worker_ready",
             {
@@ -204,10 +209,38 @@ class CeleryMonitor:
         """Handle worker process shutdown."""
         logger.info(f"Worker process shutting down")
 
+    def on_heartbeat_sent(self, sender=None, **kwargs):
+        """Refresh this worker's liveness entry on every heartbeat."""
+        hostname = getattr(getattr(sender, "eventer", None), "hostname", None)
+        if hostname:
+            self._mark_worker_alive(hostname)
+
+    def _mark_worker_alive(self, hostname: str):
+        """Record the worker's heartbeat so producers can see it without an inspect broadcast."""
+        if not self.redis_client:
+            return
+        try:
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zadd(WORKER_HEARTBEATS_KEY, {hostname: now + WORKER_HEARTBEAT_TTL})
+            # Drop lapsed workers so the set stays the size of the live fleet
+            pipe.zremrangebyscore(WORKER_HEARTBEATS_KEY, "-inf", now)
+            # The whole set goes away once no worker has sent a heartbeat for a full TTL
+            pipe.expire(WORKER_HEARTBEATS_KEY, WORKER_HEARTBEAT_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record heartbeat for {hostname}: {e}")
+
     def on_worker_shutting_down(self, sender=None, **kwargs):
         """Handle worker shutdown."""
         hostname = sender.hostname if sender else "unknown"
 
+        if self.redis_client:
+            try:
+                self.redis_client.zrem(WORKER_HEARTBEATS_KEY, hostname)
+            except Exception as e:
+                logger.warning(f"Failed to clear heartbeat for {hostname}: {e}")
+
         if hostname in self.worker_metrics:
             metrics = self.worker_metrics[hostname]
             uptime = (datetime.utcnow() - metrics.started_at).total_seconds()
@@ -3,7 +3,6 @@ Celery tasks for embedding generation and management operations.
 """
 
 import asyncio
-import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -54,9 +53,9 @@ def generate_statute_embeddings(code_type: str, force_regenerate: bool = False)
             }
 
         # Get Qdrant configuration
-        config = get_config()
-        qdrant_host = os.getenv("QDRANT_HOST", "qdrant")
-        qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
+        qdrant_config = get_config().qdrant
+        qdrant_host = qdrant_config.host
+        qdrant_port = qdrant_config.port
 
         # Process and embed statutes
         stats = process_and_embed_statutes(
@@ -148,8 +147,9 @@ def batch_generate_embeddings(
 
     try:
         # Get Qdrant configuration
-        qdrant_host = os.getenv("QDRANT_HOST", "qdrant")
-        qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
+        qdrant_config = get_config().qdrant
+        qdrant_host = qdrant_config.host
+        qdrant_port = qdrant_config.port
 
         # Initialize embedder
         embedder = PolishLegalEmbedder(qdrant_host=qdrant_host, qdrant_port=qdrant_port)
@@ -186,9 +186,7 @@ def get_embedding_statistics(collection_name: Optional[str] = None) -> Dict[str,
         try:
             from qdrant_client import AsyncQdrantClient
 
-            qdrant_host = os.getenv("QDRANT_HOST", "qdrant")
-            qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
-            qdrant_url = f"http://{qdrant_host}:{qdrant_port}"
+            qdrant_url = get_config().qdrant.url
 
             client = AsyncQdrantClient(url=qdrant_url)
 
@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional, Tuple, List, Union, cast
 
 import redis
 
-from app.core.config_service import ConfigService
+from app.core.config_service import get_config
 from app.core.logger_manager import get_logger
 from app.worker.celery_app import celery_app
 from app.worker.service_registry import get_worker_services
@@ -241,6 +241,42 @@ def cleanup_expired_results(self, days_to_keep: int = 7) -> Dict[str, Any]:
         return {"status": "error", "error": str(e), "timestamp": datetime.utcnow().isoformat()}
 
 
+@celery_app.task(name="worker.tasks.maintenance.cleanup_expired_sessions", bind=True)
+def cleanup_expired_sessions(self) -> Dict[str, Any]:
+    """
+    Delete expired user sessions with a single DELETE statement.
+
+    Returns:
+        Cleanup statistics
+    """
+    logger.info("Cleaning up expired user sessions")
+
+    async def _process():
+        from sqlalchemy import delete
+
+        from app.models import UserSession
+
+        db_manager = get_worker_services().db_manager
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                delete(UserSession).where(UserSession.expires_at < datetime.utcnow())  # type: ignore
+            )
+            await session.commit()
+            return result.rowcount or 0
+
+    try:
+        deleted = run_async(_process())
+        logger.info(f"Deleted {deleted} expired user sessions")
+        return {
+            "status": "success",
+            "timestamp": datetime.utcnow().isoformat(),
+            "sessions_deleted": deleted,
+        }
+    except Exception as e:
+        logger.error(f"Error cleaning up expired sessions: {e}", exc_info=True)
+        return {"status": "error", "error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
+
 @celery_app.task(name="worker.tasks.maintenance.process_dead_letter_queue", bind=True)
 def process_dead_letter_queue(self, max_retries: int = 1, requeue: bool = False) -> Dict[str, Any]:
     """
@@ -464,12 +500,10 @@ def update_vector_indices(self) -> Dict[str, Any]:
     logger.info("Updating vector indices")
 
     try:
-        config_service = ConfigService()
+        qdrant_config = get_config().qdrant
         from qdrant_client import QdrantClient
 
-        qdrant_client = QdrantClient(
-            host=config_service.config.qdrant.host, port=config_service.config.qdrant.port
-        )
+        qdrant_client = QdrantClient(host=qdrant_config.host, port=qdrant_config.port)
 
         stats = {
             "status": "success",
@@ -9,9 +9,10 @@ import json
 import redis.asyncio as redis
 from sqlalchemy import select
 
-from app.core.conversation_manager import ConversationManager, ConversationState
+from app.core.conversation_manager import ConversationManager, ConversationState, _make_key
 from app.core.database_manager import DatabaseManager
 from app.core.config_service import ConfigService
+from app.core.performance_utils import AsyncCache
 from app.core.service_interface import ServiceStatus
 from app.models import ResponseHistory, Case
 
@@ -30,6 +31,7 @@ def mock_config_service():
     config_service = Mock(spec=ConfigService)
     config_service.config = Mock()
     config_service.config.redis.url = "redis://localhost:6379/0"
+    config_service.config.redis.fallback_cache_size = 100
     return config_service
 
 
@@ -42,6 +44,62 @@ def mock_db_manager():
     return db_manager
 
 
+def make_redis_client(*results):
+    """Redis client mock whose pipelines queue commands and return ``results`` in turn"""
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock(side_effect=list(results))
+    client = AsyncMock()
+    client.pipeline = Mock(return_value=pipe)
+    return client, pipe
+
+
+class SharedRedis:
+    """In-memory stand-in for one Redis server shared by several managers"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return SharedRedisPipeline(self.data)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+
+class SharedRedisPipeline:
+    """Queues commands and applies them to the shared data on execute"""
+
+    def __init__(self, data):
+        self._data = data
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get(self, key):
+        self._commands.append(lambda: self._data.get(key))
+
+    def expire(self, key, ttl):
+        self._commands.append(lambda: key in self._data)
+
+    def exists(self, key):
+        self._commands.append(lambda: int(key in self._data))
+
+    def setex(self, key, ttl, value):
+        self._commands.append(lambda: self._data.__setitem__(key, value) or True)
+
+    async def execute(self):
+        commands, self._commands = self._commands, []
+        return [command() for command in commands]
+
+
 @pytest.fixture
 async def conversation_manager(mock_config_service, mock_db_manager):
     """Create ConversationManager instance"""
@@ -80,8 +138,10 @@ class TestConversationStateManagement:
         
         assert data["conversation_id"] == "conv_123"
         assert data["metadata"] == {"key": "value"}
-        assert "created_at" in data
-        assert "updated_at" in data
+        assert data["created_at"] == state.created_at.isoformat()
+        assert data["updated_at"] == state.updated_at.isoformat()
+        # Must stay plain-JSON serializable
+        json.dumps(data)
     
     def test_conversation_state_deserialization(self):
         """Test deserialization from dict"""
@@ -101,6 +161,58 @@ class TestConversationStateManagement:
         assert state.last_response_id == "resp_456"
         assert state.metadata == {"key": "value"}
 
+    def test_conversation_state_dict_round_trip(self):
+        """Test from_dict(to_dict(x)) restores the state, also through JSON"""
+        state = ConversationState(
+            conversation_id="conv_123",
+            last_response_id="resp_456",
+            case_id="case_789",
+            user_id="user_abc",
+            metadata={"key": "value"}
+        )
+
+        assert ConversationState.from_dict(state.to_dict()) == state
+        assert ConversationState.from_dict(json.loads(json.dumps(state.to_dict()))) == state
+
+    def test_conversation_state_from_dict_accepts_datetimes(self):
+        """Test from_dict takes datetime objects as well as ISO strings"""
+        now = datetime.now()
+        state = ConversationState.from_dict(
+            {"conversation_id": "conv_123", "created_at": now, "updated_at": now}
+        )
+
+        assert state.created_at == now
+        assert state.updated_at == now
+
+    def test_conversation_state_cache_round_trip(self):
+        """Test from_cache(to_cache(x)) restores the state"""
+        state = ConversationState(
+            conversation_id="conv_123",
+            last_response_id="resp_456",
+            case_id="case_789",
+            user_id="user_abc",
+            metadata={"key": "value", "nested": {"n": 1}}
+        )
+
+        assert ConversationState.from_cache(state.to_cache()) == state
+
+    def test_conversation_state_cache_format(self):
+        """Test the cached payload uses short keys and epoch timestamps"""
+        state = ConversationState(conversation_id="conv_123", user_id="user_abc")
+
+        data = json.loads(state.to_cache())
+
+        assert data == {
+            "c": "conv_123",
+            "r": None,
+            "k": None,
+            "u": "user_abc",
+            "ca": state.created_at.timestamp(),
+            "ua": state.updated_at.timestamp(),
+            "m": {},
+        }
+        assert state._key == b"conv:v2:conv_123"
+
 
 class TestInitialization:
     """Test ConversationManager initialization"""
@@ -110,23 +222,29 @@ class TestInitialization:
         """Test successful Redis connection"""
         mock_redis = AsyncMock()
         mock_redis.ping = AsyncMock(return_value=True)
+        mock_pool = Mock()
         
-        with patch('redis.asyncio.from_url', return_value=mock_redis):
+        with patch('redis.asyncio.ConnectionPool.from_url', return_value=mock_pool) as from_url, \
+                patch('redis.asyncio.Redis.from_pool', return_value=mock_redis) as from_pool:
             await conversation_manager.initialize()
             
             assert conversation_manager._redis_client == mock_redis
             assert conversation_manager._initialized
             mock_redis.ping.assert_called_once()
+            from_pool.assert_called_once_with(mock_pool)
+            # Raw bytes in and out; payloads are decoded by orjson
+            assert from_url.call_args.kwargs["decode_responses"] is False
     
     @pytest.mark.asyncio
     async def test_redis_failure_fallback(self, conversation_manager):
         """Test fallback to memory cache when Redis fails"""
-        with patch('redis.asyncio.from_url', side_effect=Exception("Redis connection failed")):
+        connection_error = Exception("Redis connection failed")
+        with patch('redis.asyncio.ConnectionPool.from_url', side_effect=connection_error):
             await conversation_manager.initialize()
             
             assert conversation_manager._redis_client is None
-            assert hasattr(conversation_manager, '_memory_cache')
-            assert conversation_manager._memory_cache == {}
+            assert isinstance(conversation_manager._memory_cache, AsyncCache)
+            assert conversation_manager._memory_cache.get_metrics()["size"] == 0
             assert conversation_manager._initialized
 
 
@@ -136,46 +254,112 @@ class TestCachingStrategy:
     @pytest.mark.asyncio
     async def test_redis_cache_hit(self, conversation_manager):
         """Test getting conversation from Redis cache"""
-        conversation_manager._redis_client = AsyncMock()
-        
-        # Mock Redis get
-        cached_data = {
-            "conversation_id": "conv_123",
-            "last_response_id": "resp_456",
-            "case_id": "case_789",
-            "user_id": "user_abc",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "metadata": {}
-        }
-        conversation_manager._redis_client.get = AsyncMock(return_value=json.dumps(cached_data))
+        cached = ConversationState(
+            conversation_id="conv_123",
+            last_response_id="resp_456",
+            case_id="case_789",
+            user_id="user_abc",
+        )
+        client, pipe = make_redis_client([cached.to_cache(), True, 0])
+        conversation_manager._redis_client = client
         
-        state = await conversation_manager._get_from_cache("conv_123")
+        state, known_missing = await conversation_manager._get_and_touch("conv_123")
         
         assert state is not None
         assert state.conversation_id == "conv_123"
         assert state.last_response_id == "resp_456"
-        conversation_manager._redis_client.get.assert_called_once_with("conversation:conv_123")
+        assert not known_missing
+        pipe.get.assert_called_once_with(_make_key("conv_123"))
+    
+    @pytest.mark.asyncio
+    async def test_redis_cache_refreshes_ttl_in_same_round_trip(self, conversation_manager):
+        """Test the GET and the TTL refresh go out in one pipeline"""
+        cached = ConversationState("conv_123")
+        client, pipe = make_redis_client([cached.to_cache(), True, 0])
+        conversation_manager._redis_client = client
+        
+        await conversation_manager._get_and_touch("conv_123")
+        
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe.get.assert_called_once_with(_make_key("conv_123"))
+        pipe.expire.assert_called_once_with(_make_key("conv_123"), conversation_manager._cache_ttl)
+        pipe.execute.assert_awaited_once()
+        client.get.assert_not_called()
+        client.expire.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_local_copy_saves_decoding_unchanged_payload(self, conversation_manager):
+        """Test a payload Redis still holds is served from the local copy, not decoded"""
+        cached = ConversationState("conv_123", last_response_id="resp_456", metadata={"a": 1})
+        payload = cached.to_cache()
+        client, pipe = make_redis_client([payload, True, 0], [payload, True, 0])
+        conversation_manager._redis_client = client
+        
+        first, _ = await conversation_manager._get_and_touch("conv_123")
+        first.metadata["a"] = 2
+        with patch.object(ConversationState, "from_cache") as from_cache:
+            second, known_missing = await conversation_manager._get_and_touch("conv_123")
+        
+        # Redis is still asked every time; only the decode is skipped
+        assert pipe.execute.await_count == 2
+        from_cache.assert_not_called()
+        assert second == cached
+        assert second.metadata == {"a": 1}  # Not shared with the first caller's state
+        assert second.only_touched()
+        assert not known_missing
+    
+    @pytest.mark.asyncio
+    async def test_changed_payload_replaces_local_copy(self, conversation_manager):
+        """Test a payload that differs from the local copy is decoded, never masked"""
+        old = ConversationState("conv_123", last_response_id="resp_1")
+        new = ConversationState("conv_123", last_response_id="resp_2")
+        client, _ = make_redis_client(
+            [old.to_cache(), True, 0], [new.to_cache(), True, 0]
+        )
+        conversation_manager._redis_client = client
+        
+        await conversation_manager._get_and_touch("conv_123")
+        state, _ = await conversation_manager._get_and_touch("conv_123")
+        
+        assert state.last_response_id == "resp_2"
+        payload, _ = await conversation_manager._local_cache.get("conv_123")
+        assert payload == new.to_cache()
+    
+    @pytest.mark.asyncio
+    async def test_local_cache_keeps_newest_conversations(self, conversation_manager):
+        """Test a full local cache evicts the least recently used conversation"""
+        client, pipe = make_redis_client(*([True] for _ in range(3)))
+        conversation_manager._redis_client = client
+        local_cache = AsyncCache(max_size=2, default_ttl=timedelta(seconds=60))
+        conversation_manager._local_cache = local_cache
+        
+        for i in range(3):
+            await conversation_manager._save_to_cache(ConversationState(f"conv_{i}"))
+        
+        # The conversation just cached is still local; the oldest one was evicted
+        assert await local_cache.get("conv_2") is not None
+        assert await local_cache.get("conv_0") is None
+        assert local_cache.get_metrics()["evictions"] == 1
     
     @pytest.mark.asyncio
     async def test_redis_cache_miss(self, conversation_manager):
         """Test cache miss in Redis"""
-        conversation_manager._redis_client = AsyncMock()
-        conversation_manager._redis_client.get = AsyncMock(return_value=None)
+        client, _ = make_redis_client([None, False, 0])
+        conversation_manager._redis_client = client
         
-        state = await conversation_manager._get_from_cache("conv_123")
+        state, known_missing = await conversation_manager._get_and_touch("conv_123")
         
         assert state is None
+        assert not known_missing
     
     @pytest.mark.asyncio
     async def test_memory_cache_fallback(self, conversation_manager):
         """Test memory cache when Redis is not available"""
         conversation_manager._redis_client = None
-        conversation_manager._memory_cache = {}
         
         # Add to memory cache
         state = ConversationState("conv_123")
-        conversation_manager._memory_cache["conv_123"] = state
+        await conversation_manager._memory_cache.set("conv_123", state)
         
         retrieved = await conversation_manager._get_from_cache("conv_123")
         
@@ -184,37 +368,62 @@ class TestCachingStrategy:
     @pytest.mark.asyncio
     async def test_save_to_redis_cache(self, conversation_manager):
         """Test saving to Redis cache with TTL"""
-        conversation_manager._redis_client = AsyncMock()
+        client, pipe = make_redis_client([True])
+        conversation_manager._redis_client = client
         conversation_manager._cache_ttl = timedelta(hours=24)
         
         state = ConversationState("conv_123", user_id="user_abc")
         
         await conversation_manager._save_to_cache(state)
         
-        # Verify Redis setex was called with correct parameters
-        conversation_manager._redis_client.setex.assert_called_once()
-        call_args = conversation_manager._redis_client.setex.call_args
+        # Verify the pipelined SETEX was queued with the right parameters
+        pipe.setex.assert_called_once()
+        key, ttl, payload = pipe.setex.call_args[0]
         
-        assert call_args[0][0] == "conversation:conv_123"  # key
-        assert call_args[0][1] == 86400  # 24 hours in seconds
+        assert key == _make_key("conv_123")
+        assert ttl == timedelta(hours=24)
         
-        # Verify JSON data
-        saved_data = json.loads(call_args[0][2])
-        assert saved_data["conversation_id"] == "conv_123"
-        assert saved_data["user_id"] == "user_abc"
+        saved = ConversationState.from_cache(payload)
+        assert saved.conversation_id == "conv_123"
+        assert saved.user_id == "user_abc"
     
     @pytest.mark.asyncio
     async def test_save_to_memory_cache(self, conversation_manager):
         """Test saving to memory cache when Redis unavailable"""
         conversation_manager._redis_client = None
-        conversation_manager._memory_cache = {}
         
         state = ConversationState("conv_123")
         
         await conversation_manager._save_to_cache(state)
         
-        assert "conv_123" in conversation_manager._memory_cache
-        assert conversation_manager._memory_cache["conv_123"] == state
+        assert await conversation_manager._memory_cache.get("conv_123") == state
+    
+    @pytest.mark.asyncio
+    async def test_delete_from_memory_cache(self, conversation_manager):
+        """Test deleting from memory cache when Redis unavailable"""
+        conversation_manager._redis_client = None
+        await conversation_manager._save_to_cache(ConversationState("conv_123"))
+        
+        await conversation_manager._delete_from_cache("conv_123")
+        
+        assert await conversation_manager._get_from_cache("conv_123") is None
+    
+    @pytest.mark.asyncio
+    async def test_memory_cache_is_bounded(self, mock_config_service, mock_db_manager):
+        """Test the memory fallback keeps at most fallback_cache_size conversations"""
+        mock_config_service.config.redis.fallback_cache_size = 3
+        manager = ConversationManager(mock_db_manager, mock_config_service)
+        
+        for i in range(5):
+            await manager._save_to_cache(ConversationState(f"conv_{i}"))
+        
+        metrics = manager._memory_cache.get_metrics()
+        assert metrics["size"] == 3
+        assert metrics["evictions"] == 2
+        # The least recently used conversations are the ones dropped
+        assert await manager._get_from_cache("conv_0") is None
+        assert await manager._get_from_cache("conv_1") is None
+        assert await manager._get_from_cache("conv_4") is not None
 
 
 class TestDatabasePersistence:
@@ -314,16 +523,24 @@ class TestConversationContext:
     @pytest.mark.asyncio
     async def test_conversation_context_new(self, conversation_manager):
         """Test creating new conversation in context"""
-        conversation_manager._get_from_cache = AsyncMock(return_value=None)
+        # Cache miss with the id negatively cached, then the flush on exit
+        client, pipe = make_redis_client([None, False, 1], [True])
+        conversation_manager._redis_client = client
         conversation_manager._get_from_db = AsyncMock(return_value=None)
-        conversation_manager._save_to_cache = AsyncMock()
         
         async with conversation_manager.conversation_context("conv_123") as state:
             assert state.conversation_id == "conv_123"
             assert state.updated_at <= datetime.now()
-        
-        # Should save to cache on exit
-        conversation_manager._save_to_cache.assert_called_once()
+            # Creating the state is buffered, not written yet
+            pipe.setex.assert_not_called()
+        
+        # The creation and the exit update go out as one SETEX in one pipeline
+        conversation_manager._get_from_db.assert_not_called()
+        assert pipe.execute.await_count == 2
+        pipe.setex.assert_called_once()
+        key, _, payload = pipe.setex.call_args[0]
+        assert key == _make_key("conv_123")
+        assert ConversationState.from_cache(payload) == state
     
     @pytest.mark.asyncio
     async def test_conversation_context_existing(self, conversation_manager):
@@ -349,6 +566,101 @@ class TestConversationContext:
         assert saved_state.last_response_id == "resp_789"
 
 
+class TestBatchedWrites:
+    """Test pipelined cache writes and write batching"""
+    
+    @pytest.mark.asyncio
+    async def test_touched_state_refreshes_ttl_only(self, conversation_manager):
+        """Test a state whose only change is updated_at gets EXPIRE, not SETEX"""
+        client, pipe = make_redis_client([True])
+        conversation_manager._redis_client = client
+        state = ConversationState("conv_123")
+        state.mark_saved()
+        state.updated_at = datetime.now()
+        
+        await conversation_manager._save_many_to_cache([state])
+        
+        pipe.expire.assert_called_once_with(state._key, conversation_manager._cache_ttl)
+        pipe.setex.assert_not_called()
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_changed_state_is_rewritten(self, conversation_manager):
+        """Test a changed state gets a SETEX with its full payload"""
+        client, pipe = make_redis_client([True])
+        conversation_manager._redis_client = client
+        state = ConversationState("conv_123")
+        state.mark_saved()
+        state.last_response_id = "resp_456"
+        
+        await conversation_manager._save_many_to_cache([state])
+        
+        pipe.expire.assert_not_called()
+        pipe.setex.assert_called_once_with(
+            state._key, conversation_manager._cache_ttl, state.to_cache()
+        )
+        assert state.only_touched()  # Marked as saved
+    
+    @pytest.mark.asyncio
+    async def test_expired_key_is_written_back(self, conversation_manager):
+        """Test a touched state whose key is gone from Redis is written in full"""
+        # EXPIRE reports the key missing, then the rewrite succeeds
+        client, pipe = make_redis_client([False], [True])
+        conversation_manager._redis_client = client
+        state = ConversationState("conv_123")
+        state.mark_saved()
+        
+        await conversation_manager._save_many_to_cache([state])
+        
+        pipe.expire.assert_called_once_with(state._key, conversation_manager._cache_ttl)
+        pipe.setex.assert_called_once_with(
+            state._key, conversation_manager._cache_ttl, state.to_cache()
+        )
+        assert pipe.execute.await_count == 2
+        payload, _ = await conversation_manager._local_cache.get("conv_123")
+        assert payload == state.to_cache()
+    
+    @pytest.mark.asyncio
+    async def test_mixed_states_share_one_pipeline(self, conversation_manager):
+        """Test touched and changed states are flushed in a single round-trip"""
+        client, pipe = make_redis_client([True, True])
+        conversation_manager._redis_client = client
+        touched = ConversationState("conv_1")
+        touched.mark_saved()
+        changed = ConversationState("conv_2")
+        
+        await conversation_manager._save_many_to_cache([touched, changed])
+        
+        pipe.expire.assert_called_once_with(touched._key, conversation_manager._cache_ttl)
+        pipe.setex.assert_called_once()
+        assert pipe.setex.call_args[0][0] == changed._key
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_nested_batched_writes_flush_once(self, conversation_manager):
+        """Test only the outermost batched_writes block flushes"""
+        client, pipe = make_redis_client([True, True])
+        conversation_manager._redis_client = client
+        first = ConversationState("conv_1")
+        second = ConversationState("conv_2")
+        
+        async with conversation_manager.batched_writes():
+            await conversation_manager.update_conversation(first)
+            async with conversation_manager.batched_writes():
+                await conversation_manager.update_conversation(second)
+                await conversation_manager.update_conversation(second, "resp_456")
+            # Leaving the inner block sends nothing
+            pipe.execute.assert_not_awaited()
+            # Buffered states are visible to reads
+            assert await conversation_manager.get_or_create_conversation("conv_2") is second
+        
+        pipe.execute.assert_awaited_once()
+        # Repeated writes of one conversation collapse into a single SETEX
+        assert [c[0][0] for c in pipe.setex.call_args_list] == [first._key, second._key]
+        saved = ConversationState.from_cache(pipe.setex.call_args[0][2])
+        assert saved.last_response_id == "resp_456"
+
+
 class TestCaseLinking:
     """Test case linking functionality"""
     
@@ -452,9 +764,23 @@ class TestConcurrentAccess:
     @pytest.mark.asyncio
     async def test_concurrent_cache_updates(self, conversation_manager):
         """Test concurrent updates to same conversation"""
+        pipes = []
+        
+        def pipeline(**kwargs):
+            pipe = MagicMock()
+            pipe.__aenter__.return_value = pipe
+            
+            async def execute():
+                if pipe.get.called:
+                    return [None, False, 1]  # Miss, known to have no history
+                return [True] * pipe.setex.call_count
+            
+            pipe.execute = execute
+            pipes.append(pipe)
+            return pipe
+        
         conversation_manager._redis_client = AsyncMock()
-        conversation_manager._redis_client.get = AsyncMock(return_value=None)
-        conversation_manager._redis_client.setex = AsyncMock()
+        conversation_manager._redis_client.pipeline = Mock(side_effect=pipeline)
         
         # Simulate concurrent updates
         async def update_conversation(index):
@@ -468,14 +794,38 @@ class TestConcurrentAccess:
         
         assert results == [0, 1, 2, 3, 4]
         
-        # Should have multiple cache saves
-        assert conversation_manager._redis_client.setex.call_count >= 5
+        # One read pipeline and one write pipeline per context
+        assert len(pipes) == 10
+        assert sum(pipe.setex.call_count for pipe in pipes) == 5
+    
+    @pytest.mark.asyncio
+    async def test_write_from_one_manager_is_seen_by_another(
+        self, mock_config_service, mock_db_manager
+    ):
+        """Test two managers sharing one Redis, as two workers would, never serve stale state"""
+        shared = SharedRedis()
+        worker_a = ConversationManager(mock_db_manager, mock_config_service)
+        worker_b = ConversationManager(mock_db_manager, mock_config_service)
+        worker_a._redis_client = shared
+        worker_b._redis_client = shared
+        
+        await worker_a._save_to_cache(ConversationState("conv_123", last_response_id="resp_1"))
+        state, _ = await worker_b._get_and_touch("conv_123")
+        assert state.last_response_id == "resp_1"  # Worker B now holds a local copy
+        
+        # Worker A moves the conversation forward
+        state, _ = await worker_a._get_and_touch("conv_123")
+        state.last_response_id = "resp_2"
+        await worker_a._save_to_cache(state)
+        
+        state, _ = await worker_b._get_and_touch("conv_123")
+        assert state.last_response_id == "resp_2"
+        assert (await worker_b._get_from_cache("conv_123")).last_response_id == "resp_2"
     
     @pytest.mark.asyncio
     async def test_memory_cache_thread_safety(self, conversation_manager):
         """Test memory cache with concurrent access"""
         conversation_manager._redis_client = None
-        conversation_manager._memory_cache = {}
         
         # Simulate concurrent access to memory cache
         async def access_cache(index):
@@ -488,7 +838,7 @@ class TestConcurrentAccess:
         results = await asyncio.gather(*[access_cache(i) for i in range(10)])
         
         assert all(results)
-        assert len(conversation_manager._memory_cache) == 10
+        assert conversation_manager._memory_cache.get_metrics()["size"] == 10
 
 
 class TestEdgeCases:
@@ -498,14 +848,14 @@ class TestEdgeCases:
     async def test_cache_ttl_expiration(self, conversation_manager):
         """Test cache TTL expiration behavior"""
         conversation_manager._cache_ttl = timedelta(seconds=1)
-        conversation_manager._redis_client = AsyncMock()
+        client, pipe = make_redis_client([True])
+        conversation_manager._redis_client = client
         
         state = ConversationState("conv_123")
         await conversation_manager._save_to_cache(state)
         
         # Verify TTL was set to 1 second
-        call_args = conversation_manager._redis_client.setex.call_args
-        assert call_args[0][1] == 1  # TTL in seconds
+        assert pipe.setex.call_args[0][1] == timedelta(seconds=1)
     
     @pytest.mark.asyncio
     async def test_invalid_json_in_cache(self, conversation_manager):
@@ -16,7 +16,7 @@ from app.core import (
 )
 from app.core.database_manager import DatabaseManager
 from app.core.tool_executor import ToolExecutor, CircuitState
-from app.core.conversation_manager import ConversationManager
+from app.core.conversation_manager import ConversationManager, ConversationState
 from app.core.streaming_handler import StreamingHandler, StreamEventType, StreamEvent
 from app.paralegal_agents.refactored_agent_sdk import ParalegalAgentSDK
 from app.core.service_interface import ServiceStatus
@@ -394,44 +394,49 @@ class TestCacheIntegration:
     async def test_conversation_caching_workflow(self):
         """Test conversation caching between Redis and database"""
         db_manager = Mock()
-        conv_manager = ConversationManager(db_manager)
-        
-        # Mock Redis available
+        config_service = Mock()
+        config_service.config.redis.fallback_cache_size = 100
+        conv_manager = ConversationManager(db_manager, config_service)
+        
+        # Mock Redis available: a miss, then the write, then a hit
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(side_effect=[[None, False, 0], [True]])
         conv_manager._redis_client = AsyncMock()
-        conv_manager._redis_client.get = AsyncMock(return_value=None)
-        conv_manager._redis_client.setex = AsyncMock()
+        conv_manager._redis_client.pipeline = Mock(return_value=pipe)
         
-        # Mock database response
+        # Mock database response: the latest response row of the thread
         mock_session = AsyncMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
         
-        mock_history = Mock()
-        mock_history.thread_id = "conv_123"
-        mock_history.response_id = "resp_456"
         mock_result = Mock()
-        mock_result.scalar_one_or_none = Mock(return_value=mock_history)
+        mock_result.one_or_none = Mock(return_value=("resp_456", datetime.now(), {}))
         mock_session.execute = AsyncMock(return_value=mock_result)
         
-        db_manager.get_session.return_value = mock_session
+        db_manager.read_session.return_value = mock_session
         
         # First call - should hit database
         state1 = await conv_manager.get_or_create_conversation("conv_123")
         assert state1.conversation_id == "conv_123"
+        assert state1.last_response_id == "resp_456"
         assert mock_session.execute.called
         
-        # Should save to cache
-        assert conv_manager._redis_client.setex.called
+        # Should save to cache under the versioned key in the compact format
+        pipe.setex.assert_called_once()
+        key, _, cache_data = pipe.setex.call_args[0]
+        assert key == b"conv:v2:conv_123"
+        assert ConversationState.from_cache(cache_data) == state1
         
         # Mock cache hit for second call
-        cache_data = json.dumps(state1.to_dict())
-        conv_manager._redis_client.get = AsyncMock(return_value=cache_data)
+        pipe.execute = AsyncMock(return_value=[cache_data, True, 0])
         
         # Second call - should hit cache
         mock_session.execute.reset_mock()
         state2 = await conv_manager.get_or_create_conversation("conv_123")
         
         assert state2.conversation_id == "conv_123"
+        assert state2.last_response_id == "resp_456"
         assert not mock_session.execute.called  # Database not queried
 
 
@@ -0,0 +1,307 @@
+"""
+Tests for password hashing, token decoding and the authentication caches.
+"""
+import pytest
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import bcrypt
+import jwt
+from fastapi import HTTPException
+
+from app import auth
+from app.auth import (
+    authenticate_password,
+    calibrate_bcrypt_rounds,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    invalidate_cached_user,
+    password_needs_rehash,
+    verify_password,
+)
+from app.core.performance_utils import AsyncCache
+from app.models import User, UserRole
+from app.routes.auth import login
+
+
+def make_user(user_id: str) -> User:
+    return User(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        full_name="Test User",
+        hashed_password="hashed",
+    )
+
+
+def make_session(*users: User) -> AsyncMock:
+    """Session mock that loads the given users by id and merges without a query"""
+    by_id = {user.id: user for user in users}
+    session = AsyncMock()
+    session.get = AsyncMock(side_effect=lambda model, user_id: by_id.get(user_id))
+    session.merge = AsyncMock(side_effect=lambda instance, load=True: instance)
+    return session
+
+
+def bcrypt_hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+@pytest.fixture
+def cheap_bcrypt():
+    """Hash at the minimum bcrypt cost so tests stay fast"""
+    with patch("app.auth._bcrypt_rounds", 4), patch("app.auth._dummy_hash", None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+async def clear_auth_caches():
+    """Start every test with empty token and user caches"""
+    await auth._token_cache.clear()
+    await auth._user_cache.clear()
+    yield
+    await auth._token_cache.clear()
+    await auth._user_cache.clear()
+
+
+class TestPasswordHashing:
+    """Test native bcrypt hashing with the passlib fallback"""
+
+    @pytest.mark.asyncio
+    async def test_bcrypt_hash_verifies(self):
+        """Test a $2b$ hash is checked by native bcrypt"""
+        hashed = bcrypt_hash("secret", 4)
+        assert hashed.startswith("$2b$")
+
+        with patch("app.auth._legacy_pwd_context") as legacy:
+            assert await verify_password("secret", hashed)
+            assert not await verify_password("wrong", hashed)
+
+        legacy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_hash_goes_through_passlib(self):
+        """Test a non-bcrypt hash is handed to the passlib context"""
+        legacy_hash = "$pbkdf2-sha256$29000$salt$checksum"
+        context = Mock()
+        context.verify = Mock(return_value=True)
+
+        with patch("app.auth._legacy_pwd_context", return_value=context):
+            assert await verify_password("secret", legacy_hash)
+
+        context.verify.assert_called_once_with("secret", legacy_hash)
+
+    @pytest.mark.asyncio
+    async def test_new_hash_uses_current_cost(self, cheap_bcrypt):
+        """Test get_password_hash produces a bcrypt hash that needs no rehash"""
+        hashed = await get_password_hash("secret")
+
+        assert hashed.startswith("$2b$04$")
+        assert not password_needs_rehash(hashed)
+        assert await verify_password("secret", hashed)
+
+    def test_low_cost_hash_needs_rehash(self):
+        """Test hashes below the calibrated cost, or not bcrypt at all, get upgraded"""
+        with patch("app.auth._bcrypt_rounds", 12):
+            assert password_needs_rehash(bcrypt_hash("secret", 10))
+            assert not password_needs_rehash("$2b$12$" + "a" * 53)
+            assert password_needs_rehash("$pbkdf2-sha256$29000$salt$checksum")
+
+    @pytest.mark.asyncio
+    async def test_unknown_email_still_compares_a_hash(self, cheap_bcrypt):
+        """Test a login for a missing user pays for a bcrypt check against a dummy hash"""
+        with patch("app.auth._verify_password_sync", wraps=auth._verify_password_sync) as verify:
+            assert not await authenticate_password("secret", None)
+
+        verify.assert_called_once()
+        plain, hashed = verify.call_args[0]
+        assert plain == "secret"
+        assert hashed.startswith("$2b$04$")
+
+    @pytest.mark.asyncio
+    async def test_known_user_password_is_checked(self):
+        """Test authenticate_password verifies against the stored hash when given one"""
+        hashed = bcrypt_hash("secret", 4)
+
+        assert await authenticate_password("secret", hashed)
+        assert not await authenticate_password("wrong", hashed)
+
+    def test_calibration_respects_bounds(self, cheap_bcrypt):
+        """Test calibration picks a cost within bounds and refreshes the dummy hash"""
+        rounds = calibrate_bcrypt_rounds(target_ms=1)
+
+        assert rounds == auth._BCRYPT_MIN_ROUNDS
+        assert auth._bcrypt_rounds == rounds
+        assert auth._dummy_hash.startswith(f"$2b${rounds:02d}$")
+
+
+class TestTokenCache:
+    """Test reuse of verified token payloads"""
+
+    @pytest.mark.asyncio
+    async def test_verified_token_is_served_from_cache(self):
+        """Test a token is verified once and then served from the cache"""
+        token = create_access_token({"user_id": "user_1"})
+
+        with patch("app.auth.decode_token", wraps=auth.decode_token) as decode:
+            first = await decode_access_token(token)
+            second = await decode_access_token(token)
+
+        assert first == second
+        assert first["user_id"] == "user_1"
+        decode.assert_called_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_full_cache_keeps_newest_token(self):
+        """Test a full cache evicts the least recently used token, not the new one"""
+        cache = AsyncCache(max_size=2, default_ttl=timedelta(seconds=60))
+        tokens = [create_access_token({"user_id": f"user_{i}"}) for i in range(3)]
+
+        with patch("app.auth._token_cache", cache), \
+                patch("app.auth.decode_token", wraps=auth.decode_token) as decode:
+            for token in tokens:
+                await decode_access_token(token)
+            decode.reset_mock()
+
+            # The newest token is still cached; the oldest one was evicted
+            await decode_access_token(tokens[2])
+            decode.assert_not_called()
+            await decode_access_token(tokens[0])
+            decode.assert_called_once_with(tokens[0])
+
+        assert cache.get_metrics()["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_raw_token(self):
+        """Test each token string gets its own cache entry"""
+        first = create_access_token({"user_id": "user_1"})
+        second = create_access_token({"user_id": "user_2"})
+
+        assert (await decode_access_token(first))["user_id"] == "user_1"
+        assert (await decode_access_token(second))["user_id"] == "user_2"
+        assert set(auth._token_cache._cache) == {first, second}
+
+    @pytest.mark.asyncio
+    async def test_cached_entry_never_outlives_token(self):
+        """Test the cache TTL is capped by the token's own expiry"""
+        token = create_access_token({"user_id": "user_1"}, timedelta(seconds=5))
+
+        await decode_access_token(token)
+
+        entry = auth._token_cache._cache[token]
+        assert entry.expires_at <= datetime.now() + timedelta(seconds=5)
+
+    @pytest.mark.asyncio
+    async def test_expired_cached_payload_is_rejected(self):
+        """Test a cached payload past its exp claim is not served"""
+        token = create_access_token({"user_id": "user_1"})
+        await auth._token_cache.set(token, {"user_id": "user_1", "exp": time.time() - 1})
+
+        with pytest.raises(jwt.ExpiredSignatureError):
+            await decode_access_token(token)
+
+
+class TestUserCache:
+    """Test the short-lived cache of authenticated users"""
+
+    @pytest.mark.asyncio
+    async def test_user_is_served_from_cache(self):
+        """Test a cached user is merged into the session instead of being reloaded"""
+        session = make_session(make_user("user_1"))
+
+        first = await auth._get_user(session, "user_1")
+        second = await auth._get_user(session, "user_1")
+
+        assert first.id == second.id == "user_1"
+        session.get.assert_awaited_once()
+        session.merge.assert_awaited_once()
+        assert session.merge.call_args.kwargs == {"load": False}
+
+    @pytest.mark.asyncio
+    async def test_invalidated_user_is_reloaded(self):
+        """Test invalidate_cached_user forces the next lookup to hit the database"""
+        session = make_session(make_user("user_1"))
+
+        await auth._get_user(session, "user_1")
+        await invalidate_cached_user("user_1")
+        await auth._get_user(session, "user_1")
+
+        assert session.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_cache_keeps_newest_user(self):
+        """Test a full cache evicts the least recently used user, not the new one"""
+        cache = AsyncCache(max_size=2, default_ttl=timedelta(seconds=15))
+        session = make_session(*(make_user(f"user_{i}") for i in range(3)))
+
+        with patch("app.auth._user_cache", cache):
+            for i in range(3):
+                await auth._get_user(session, f"user_{i}")
+            session.get.reset_mock()
+
+            await auth._get_user(session, "user_2")
+            session.get.assert_not_awaited()
+            await auth._get_user(session, "user_0")
+            session.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_cached(self):
+        """Test a missing user is looked up again next time"""
+        session = make_session()
+
+        assert await auth._get_user(session, "missing") is None
+        assert await auth._get_user(session, "missing") is None
+        assert session.get.await_count == 2
+
+
+def make_login_session(user: User, hashed_password: str) -> AsyncMock:
+    """Session mock whose email lookup returns the covering-index columns of one user"""
+    credentials = SimpleNamespace(
+        id=user.id, hashed_password=hashed_password, is_active=True, role=UserRole.CLIENT
+    )
+    result = Mock()
+    result.one_or_none = Mock(return_value=credentials)
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    session.get = AsyncMock(return_value=user)
+    session.add = Mock()
+    return session
+
+
+class TestLogin:
+    """Test the login lookup stays within the covering index"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_selects_only_covered_columns(self):
+        """Test the email lookup selects only columns included in ix_users_email_covering"""
+        hashed = bcrypt_hash("secret", 4)
+        user = make_user("user_1")
+        user.hashed_password = hashed
+        session = make_login_session(user, hashed)
+        form = SimpleNamespace(username=user.email, password="secret")
+
+        with patch("app.auth._bcrypt_rounds", 4):
+            token = await login(Mock(), form, session)
+
+        assert token.access_token
+        statement = session.execute.call_args[0][0]
+        assert [column.name for column in statement.selected_columns] == [
+            "id", "hashed_password", "is_active", "role"
+        ]
+        # The full row is loaded once, by primary key, after the password checked out
+        session.get.assert_awaited_once_with(User, "user_1")
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_never_loads_full_row(self):
+        """Test a failed login stops at the covering-index lookup"""
+        user = make_user("user_1")
+        session = make_login_session(user, bcrypt_hash("secret", 4))
+        form = SimpleNamespace(username=user.email, password="wrong")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await login(Mock(), form, session)
+
+        assert exc_info.value.status_code == 401
+        session.get.assert_not_awaited()
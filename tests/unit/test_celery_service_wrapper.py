@@ -0,0 +1,197 @@
+"""
+Tests for the Celery service wrapper: circuit breaking, worker probing and send batching.
+"""
+import pytest
+import time
+from concurrent.futures import Future
+from unittest.mock import MagicMock, Mock, patch
+
+from app.core.celery_service_wrapper import (
+    CeleryServiceWrapper,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitBreakerState,
+    TaskConfig,
+)
+from app.core.exceptions import BackpressureError
+from app.worker.config import WORKER_HEARTBEATS_KEY
+
+
+def make_wrapper(**kwargs) -> CeleryServiceWrapper:
+    """Wrapper bound to a mock Celery app instead of the worker's"""
+    with patch("app.core.celery_service_wrapper._get_celery_app", return_value=Mock()):
+        return CeleryServiceWrapper("test_service", **kwargs)
+
+
+def make_batching_wrapper(**kwargs) -> CeleryServiceWrapper:
+    """Wrapper whose publishes are recorded instead of sent to a broker"""
+    wrapper = make_wrapper(**kwargs)
+    wrapper._producer_pool = MagicMock()
+    wrapper._publish = Mock(
+        side_effect=lambda task_name, args, kwargs, queue, priority, producer=None: args[0]
+    )
+    return wrapper
+
+
+TASK = TaskConfig("test.task", "default", 5)
+
+
+def open_breaker() -> CircuitBreaker:
+    """Circuit breaker that has just tripped"""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    with pytest.raises(RuntimeError):
+        breaker.call(Mock(side_effect=RuntimeError("boom")))
+    assert breaker.state is CircuitBreakerState.OPEN
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Test rejections from an OPEN circuit breaker"""
+
+    def test_open_circuit_rejects_calls(self):
+        """Test an OPEN breaker rejects calls without invoking them"""
+        breaker = open_breaker()
+        func = Mock()
+
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(func)
+
+        func.assert_not_called()
+
+    def test_each_rejection_raises_its_own_exception(self):
+        """Test rejections never share an exception instance or its traceback state"""
+        breaker = open_breaker()
+        errors = []
+        for _ in range(2):
+            try:
+                breaker.call(Mock())
+            except CircuitBreakerOpenError as e:
+                errors.append(e)
+
+        first, second = errors
+        assert first is not second
+        # Context attached by one caller does not leak into another caller's exception
+        first.__cause__ = ValueError("caller context")
+        assert second.__cause__ is None
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_async_calls(self):
+        """Test call_async is rejected the same way"""
+        breaker = open_breaker()
+
+        async def func():
+            return "ok"
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call_async(func)
+
+    def test_half_open_after_recovery_timeout(self):
+        """Test a trial call is let through once the recovery timeout has passed"""
+        breaker = open_breaker()
+        breaker.last_failure_time = time.monotonic() - 61
+
+        assert breaker.call(Mock(return_value="ok")) == "ok"
+        assert breaker.state is CircuitBreakerState.HALF_OPEN
+
+
+class TestWorkerProbe:
+    """Test worker detection from the heartbeat sorted set"""
+
+    def test_live_heartbeat_means_workers_available(self):
+        """Test one unexpired heartbeat is enough, counted with a single ZCOUNT"""
+        wrapper = make_wrapper()
+        wrapper._heartbeat_redis = Mock()
+        wrapper._heartbeat_redis.zcount = Mock(return_value=1)
+
+        before = time.time()
+        assert wrapper._probe_worker_availability()
+
+        key, low, high = wrapper._heartbeat_redis.zcount.call_args[0]
+        assert key == WORKER_HEARTBEATS_KEY
+        # Exclusive lower bound at the current time: lapsed heartbeats do not count
+        assert low.startswith("(") and float(low[1:]) >= before
+        assert high == "+inf"
+        wrapper._heartbeat_redis.scan_iter.assert_not_called()
+
+    def test_no_live_heartbeat_means_no_workers(self):
+        """Test an empty or fully lapsed heartbeat set reports no workers"""
+        wrapper = make_wrapper()
+        wrapper._heartbeat_redis = Mock()
+        wrapper._heartbeat_redis.zcount = Mock(return_value=0)
+
+        assert not wrapper._probe_worker_availability()
+        wrapper._heartbeat_redis.scan_iter.assert_not_called()
+
+    def test_redis_error_means_no_workers(self):
+        """Test a failing probe reports no workers instead of raising"""
+        wrapper = make_wrapper()
+        wrapper._heartbeat_redis = Mock()
+        wrapper._heartbeat_redis.zcount = Mock(side_effect=ConnectionError("down"))
+
+        assert not wrapper._probe_worker_availability()
+
+
+class TestSendBatching:
+    """Test coalescing of fire-and-forget sends"""
+
+    def test_full_batch_flushes_immediately(self):
+        """Test reaching batch_max_size publishes without waiting for the delay"""
+        wrapper = make_batching_wrapper(batch_max_size=3, batch_max_delay_ms=10_000)
+
+        started = time.monotonic()
+        futures = [wrapper._execute_celery_async(TASK, i) for i in range(3)]
+
+        assert [future.result(timeout=2) for future in futures] == [0, 1, 2]
+        assert time.monotonic() - started < 5
+        # One producer checkout served the whole batch
+        wrapper._producer_pool.acquire.assert_called_once()
+        assert wrapper._publish.call_count == 3
+
+    def test_partial_batch_flushes_after_delay(self):
+        """Test a batch below batch_max_size is published once batch_max_delay_ms passes"""
+        wrapper = make_batching_wrapper(batch_max_size=100, batch_max_delay_ms=50)
+
+        started = time.monotonic()
+        future = wrapper._execute_celery_async(TASK, "only")
+
+        assert isinstance(future, Future)
+        assert future.result(timeout=2) == "only"
+        assert time.monotonic() - started >= 0.04
+        wrapper._publish.assert_called_once()
+
+    def test_backpressure_past_max_pending(self):
+        """Test sends beyond max_pending are rejected instead of buffered"""
+        wrapper = make_batching_wrapper(
+            batch_max_size=100, batch_max_delay_ms=10_000, max_pending=2
+        )
+
+        wrapper._execute_celery_async(TASK, 0)
+        wrapper._execute_celery_async(TASK, 1)
+        with pytest.raises(BackpressureError):
+            wrapper._execute_celery_async(TASK, 2)
+
+        assert wrapper._pending_count == 2
+        wrapper._publish.assert_not_called()
+
+    def test_batching_disabled_without_delay(self):
+        """Test batch_max_delay_ms=0 publishes each send directly, with no flusher"""
+        wrapper = make_batching_wrapper(batch_max_delay_ms=0)
+
+        result = wrapper._execute_celery_async(TASK, "direct")
+
+        assert result == "direct"
+        assert wrapper._flusher is None
+        assert wrapper._pending_batches == {}
+        assert wrapper._publish.call_args.kwargs["producer"] is not None
+
+    def test_batch_size_tuning(self):
+        """Test a busy flusher grows its batches and an idle one shrinks them"""
+        busy = make_wrapper(batch_max_size=50)
+        busy._tune_batch_size(0.0, 1.0)
+        busy._tune_batch_size(1.0, 1.0)  # Flushing the whole time
+        assert busy.batch_max_size > 50
+
+        idle = make_wrapper(batch_max_size=50)
+        idle._tune_batch_size(0.0, 0.01)
+        idle._tune_batch_size(1.0, 0.01)  # Flushing 1% of the time
+        assert idle.batch_max_size < 50
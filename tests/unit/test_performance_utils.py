@@ -146,6 +146,49 @@ class TestAsyncCache:
         assert len(cache._cache) == 3
         assert "key2" not in cache._cache
         assert all(key in cache._cache for key in ["key1", "key3", "key4"])
+        assert cache.get_metrics()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_keeps_newest_entries_under_burst(self):
+        """Test a burst of new keys evicts the oldest ones, not the one just inserted"""
+        cache = AsyncCache(max_size=3)
+
+        for i in range(10):
+            await cache.set(f"key{i}", i)
+
+        assert list(cache._cache) == ["key7", "key8", "key9"]
+        assert await cache.get("key9") == 9
+        assert cache.get_metrics()["evictions"] == 7
+
+    @pytest.mark.asyncio
+    async def test_cache_overwrite_at_capacity(self):
+        """Test overwriting an existing key refreshes it without evicting anything"""
+        cache = AsyncCache(max_size=3)
+
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key3", "value3")
+
+        await cache.set("key1", "updated")  # key1 becomes most recently used
+        await cache.set("key4", "value4")  # Should evict key2
+
+        assert list(cache._cache) == ["key3", "key1", "key4"]
+        assert await cache.get("key1") == "updated"
+        assert cache.get_metrics()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_delete(self):
+        """Test removing a single entry"""
+        cache = AsyncCache()
+        
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        
+        await cache.delete("key1")
+        await cache.delete("missing")  # Deleting an absent key is a no-op
+        
+        assert await cache.get("key1") is None
+        assert await cache.get("key2") == "value2"
     
     @pytest.mark.asyncio
     async def test_cache_clear(self):